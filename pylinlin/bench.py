@@ -0,0 +1,253 @@
+"""Reproducible benchmarks for the core operations and factorizations.
+
+Times each benchmark case over a sweep of sizes and shapes on seeded random
+inputs, and reports the median and 95th percentile over repeated runs after
+a number of warmup runs. Results can be saved as JSON and compared against a
+saved baseline, exiting with a non-zero status if any case regressed.
+
+With --memory, one extra run of each case is traced with tracemalloc to
+record its peak bytes allocated, and the run fails if any case exceeds its
+allocation budget of O(max(rows, cols)^2) bytes.
+
+    Typical usage example:
+
+    $ python -m pylinlin.bench --sizes 2 4 8 --output baseline.json
+    $ python -m pylinlin.bench --sizes 2 4 8 --baseline baseline.json
+    $ python -m pylinlin.bench --sizes 2 4 8 --memory
+"""
+
+from pylinlin.matrix import Matrix
+from pylinlin.matrix_view import MatrixView
+from pylinlin.householder import Householder
+from pylinlin.givens import Givens
+from pylinlin.lu_factorization import compute_lu_factorization
+from pylinlin.qr_factorization import compute_qr_factorization
+from pylinlin.svd import compute_svd
+from pylinlin.instrumentation import measure_peak_memory
+from time import perf_counter
+from typing import Callable, Dict, List
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+
+
+def random_matrix(rng: random.Random, num_rows: int, num_cols: int) -> Matrix:
+    return Matrix.from_cols([[rng.gauss(0, 1) for _ in range(num_rows)] for _ in range(num_cols)])
+
+
+def setup_multiply(rng, num_rows, num_cols):
+    lhs = random_matrix(rng, num_rows, num_cols)
+    rhs = random_matrix(rng, num_cols, num_rows)
+    return lambda: lhs.multiply(rhs)
+
+
+def setup_transpose(rng, num_rows, num_cols):
+    mat = random_matrix(rng, num_rows, num_cols)
+    return mat.transpose
+
+
+def setup_view_to_matrix(rng, num_rows, num_cols):
+    view = MatrixView.to_end(random_matrix(rng, num_rows, num_cols), (0, 0))
+    return view.to_matrix
+
+
+def setup_view_scale_add(rng, num_rows, num_cols):
+    view = MatrixView.to_end(random_matrix(rng, num_rows, num_cols), (0, 0))
+    other = MatrixView.to_end(random_matrix(rng, num_rows, num_cols), (0, 0))
+    return lambda: view.scale_add(other, 0.5)
+
+
+def setup_householder(rng, num_rows, num_cols):
+    mat = random_matrix(rng, num_rows, num_cols)
+    householder = Householder(mat.get_col(0))
+    return lambda: householder.multiply_left(mat)
+
+
+def setup_givens(rng, num_rows, num_cols):
+    mat = random_matrix(rng, num_rows, num_cols)
+    givens = Givens(mat.get(0, 0), mat.get(1, 0))
+    return lambda: givens.multiply_left(mat)
+
+
+def setup_lu(rng, num_rows, num_cols):
+    mat = random_matrix(rng, num_rows, num_cols)
+    return lambda: compute_lu_factorization(mat)
+
+
+def setup_qr(rng, num_rows, num_cols):
+    mat = random_matrix(rng, num_rows, num_cols)
+    return lambda: compute_qr_factorization(mat)
+
+
+def setup_svd(rng, num_rows, num_cols):
+    mat = random_matrix(rng, num_rows, num_cols)
+    return lambda: compute_svd(mat)
+
+
+# Each case maps to a function taking (rng, num_rows, num_cols)
+# and returning the zero-argument callable to be timed
+CASES: Dict[str, Callable] = {
+    "matrix.multiply": setup_multiply,
+    "matrix.transpose": setup_transpose,
+    "matrix_view.to_matrix": setup_view_to_matrix,
+    "matrix_view.scale_add": setup_view_scale_add,
+    "householder.multiply_left": setup_householder,
+    "givens.multiply_left": setup_givens,
+    "lu": setup_lu,
+    "qr": setup_qr,
+    "svd": setup_svd,
+}
+
+SHAPES = {
+    "square": lambda size: (size, size),
+    "tall": lambda size: (2 * size, size),
+    "wide": lambda size: (size, 2 * size),
+}
+
+
+def memory_budget(num_rows: int, num_cols: int) -> int:
+    # Every case should allocate O(n^2) bytes for an n x n problem. A Python
+    # float takes 24 bytes plus an 8 byte slot in its column list, and the
+    # algorithms keep a handful of matrices alive, plus a fixed overhead.
+    elements = max(num_rows, num_cols) ** 2
+    return 256 * elements + 16 * 1024
+
+
+def percentile(timings: List[float], fraction: float) -> float:
+    # nearest-rank percentile
+    ordered = sorted(timings)
+    rank = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def time_case(func: Callable, repeat: int, warmup: int) -> List[float]:
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        time_start = perf_counter()
+        func()
+        time_stop = perf_counter()
+        timings.append(time_stop - time_start)
+    return timings
+
+
+def result_key(result: dict) -> (str, str, int):
+    return (result["case"], result["shape"], result["size"])
+
+
+def run_benchmarks(cases: List[str], sizes: List[int], shapes: List[str],
+                   repeat: int = 10, warmup: int = 2, seed: int = 0,
+                   memory: bool = False) -> List[dict]:
+    results = []
+    for case in cases:
+        for shape in shapes:
+            for size in sizes:
+                num_rows, num_cols = SHAPES[shape](size)
+                # seed each case separately so results do not depend on which cases run
+                rng = random.Random(f"{seed}-{case}-{shape}-{size}")
+                func = CASES[case](rng, num_rows, num_cols)
+                timings = time_case(func, repeat, warmup)
+                result = {
+                    "case": case,
+                    "shape": shape,
+                    "size": size,
+                    "rows": num_rows,
+                    "cols": num_cols,
+                    "repeat": repeat,
+                    "median": statistics.median(timings),
+                    "p95": percentile(timings, 0.95),
+                    "min": min(timings),
+                }
+                if memory:
+                    result["peak_bytes"] = measure_peak_memory(func)
+                    result["memory_budget"] = memory_budget(num_rows, num_cols)
+                results.append(result)
+    return results
+
+
+def over_budget(results: List[dict]) -> List[dict]:
+    return [result for result in results
+            if "peak_bytes" in result and result["peak_bytes"] > result["memory_budget"]]
+
+
+def compare_results(results: List[dict], baseline: List[dict], threshold: float) -> List[dict]:
+    # Returns the results whose median is more than threshold times the baseline median
+    baseline_by_key = {result_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        reference = baseline_by_key.get(result_key(result))
+        if reference is None or reference["median"] <= 0:
+            continue
+        ratio = result["median"] / reference["median"]
+        if ratio > threshold:
+            regressions.append(dict(result, baseline_median=reference["median"], ratio=ratio))
+    return regressions
+
+
+def format_results(results: List[dict]) -> str:
+    memory = any("peak_bytes" in result for result in results)
+    header = f"{'case':28s} {'shape':7s} {'rows':>5s} {'cols':>5s} {'median':>12s} {'p95':>12s}"
+    if memory:
+        header += f" {'peak bytes':>12s} {'budget':>12s}"
+    lines = [header]
+    for result in results:
+        line = (f"{result['case']:28s} {result['shape']:7s} {result['rows']:5d} {result['cols']:5d} "
+                f"{result['median']:12.6f} {result['p95']:12.6f}")
+        if memory:
+            line += f" {result['peak_bytes']:12d} {result['memory_budget']:12d}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m pylinlin.bench", description="Benchmark pylinlin operations.")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[2, 4, 8])
+    parser.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=list(SHAPES))
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against results saved with --output")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio of medians counted as a regression")
+    parser.add_argument("--memory", action="store_true",
+                        help="measure peak bytes allocated and check allocation budgets")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.cases, args.sizes, args.shapes,
+                             repeat=args.repeat, warmup=args.warmup, seed=args.seed,
+                             memory=args.memory)
+    print(format_results(results))
+    status = 0
+    for result in over_budget(results):
+        print(f"OVER BUDGET {result['case']} {result['shape']} {result['size']}: "
+              f"{result['peak_bytes']} bytes allocated, budget {result['memory_budget']}")
+        status = 1
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump({
+                "python": platform.python_version(),
+                "seed": args.seed,
+                "results": results,
+            }, fh, indent=2)
+    if args.baseline:
+        with open(args.baseline, "r") as fh:
+            baseline = json.load(fh)["results"]
+        regressions = compare_results(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['case']} {regression['shape']} {regression['size']}: "
+                  f"{regression['ratio']:.2f}x slower than baseline")
+        if regressions:
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Memoization of factorizations keyed by matrix contents.
+
+Results are stored packed as arrays of doubles and unpacked into fresh
+matrices on every lookup, so callers can freely modify what they receive
+without corrupting the cache. Entries are evicted least recently used first
+once the packed results exceed the byte budget.
+
+    Typical usage example:
+
+    from pylinlin.cache import FactorizationCache
+
+    cache = FactorizationCache(max_bytes=64 * 1024 * 1024)
+    q, r = cache.compute_qr_factorization(matrix)
+    q, r = cache.compute_qr_factorization(matrix)  # served from the cache
+    cache.stats()  # {"hits": 1, "misses": 1, ...}
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Callable, Tuple
+from pylinlin.matrix import Matrix
+from pylinlin.lu_factorization import compute_lu_factorization
+from pylinlin.qr_factorization import compute_qr_factorization
+from pylinlin.svd import compute_svd
+import hashlib
+import threading
+
+
+class FactorizationCache:
+    """A thread-safe LRU cache of factorizations bounded by bytes."""
+
+    def __init__(self: FactorizationCache, max_bytes: int = 64 * 1024 * 1024):
+        """Initializes an empty cache.
+
+        Parameters
+        ----------
+        max_bytes : int
+            Maximum total size of the cached results, in bytes of packed doubles.
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(name: str, mat: Matrix) -> tuple:
+        """Computes the cache key of a factorization of a matrix from its contents and shape."""
+        digest = hashlib.blake2b(mat.to_array().tobytes(), digest_size=16).hexdigest()
+        return (name, mat.num_rows(), mat.num_cols(), digest)
+
+    def get_or_compute(self: FactorizationCache, name: str,
+                       func: Callable[[Matrix], Tuple[Matrix, ...]], mat: Matrix) -> Tuple[Matrix, ...]:
+        """Returns func(mat), reusing a cached result for an identical matrix.
+
+        Parameters
+        ----------
+        name : str
+            Name of the factorization, used to tell apart results of different functions.
+
+        func : Callable[[Matrix], Tuple[Matrix, ...]]
+            The factorization, returning a tuple of matrices.
+
+        mat : Matrix
+            The matrix to factorize.
+
+        Returns
+        -------
+        Tuple[Matrix, ...]
+            Fresh copies of the factors.
+        """
+        key = FactorizationCache.key(name, mat)
+        with self._lock:
+            packed = self._entries.get(key)
+            if packed is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if packed is None:
+            result = func(mat)
+            packed = tuple((factor.to_array(), factor.num_rows(), factor.num_cols()) for factor in result)
+            self._store(key, packed)
+        return tuple(Matrix.from_buffer(*entry) for entry in packed)
+
+    def _store(self: FactorizationCache, key: tuple, packed: tuple):
+        size = sum(len(values) * values.itemsize for values, _, _ in packed)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = packed
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= sum(len(values) * values.itemsize for values, _, _ in evicted)
+                self.evictions += 1
+
+    def compute_lu_factorization(self: FactorizationCache, mat: Matrix) -> (Matrix, Matrix):
+        return self.get_or_compute("lu", compute_lu_factorization, mat)
+
+    def compute_qr_factorization(self: FactorizationCache, mat: Matrix) -> (Matrix, Matrix):
+        return self.get_or_compute("qr", compute_qr_factorization, mat)
+
+    def compute_svd(self: FactorizationCache, mat: Matrix) -> (Matrix, Matrix, Matrix):
+        return self.get_or_compute("svd", compute_svd, mat)
+
+    def stats(self: FactorizationCache) -> dict:
+        """Get the hit, miss and eviction counts and the current size of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self: FactorizationCache):
+        """Removes all entries. The hit and miss counts are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
@@ -47,6 +47,22 @@ class Givens:
         affected.set(MatrixView.whole(product))
         return mat
 
+    def apply_left_inplace(self: Givens, mat: Matrix, row1: int, row2: int):
+        # Overwrites rows row1 and row2 of mat with G * [row1; row2]
+        c, s = self.x1, self.x2
+        for col in mat.all_cols():
+            a, b = col[row1], col[row2]
+            col[row1] = c * a + s * b
+            col[row2] = c * b - s * a
+
+    def apply_right_inplace(self: Givens, mat: Matrix, col1: int, col2: int):
+        # Overwrites columns col1 and col2 of mat with [col1 col2] * G
+        c, s = self.x1, self.x2
+        cols = mat.all_cols()
+        first, second = cols[col1], cols[col2]
+        cols[col1] = [c * a - s * b for a, b in zip(first, second)]
+        cols[col2] = [s * a + c * b for a, b in zip(first, second)]
+
     def to_matrix(self: Givens, pad_top: int = 0, dims: int = 2):
         mat = Matrix.identity(dims)
         MatrixView.with_size(mat, (pad_top, pad_top), (2, 2)).set(
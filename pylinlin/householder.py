@@ -30,7 +30,7 @@ class Householder:
         # (Ix - 2uuTx)
         full_x = Matrix.from_cols([vec[:]])
         x = Matrix.from_cols([vec[pad_top:]])
-        factor = self.base.transpose().multiply(x)
+        factor = self.base.multiply(x, transpose_self=True)
         factor = factor.get(0, 0)
         MatrixView.to_end(full_x, (pad_top, 0)).scale_add(
             MatrixView.to_end(self.base, (0, 0)),
@@ -47,6 +47,6 @@ class Householder:
 
     def to_matrix(self: Householder) -> Matrix:
         householder_mat = Matrix.identity(self.base.num_rows())
-        update = self.base.multiply(self.base.transpose())
+        update = self.base.multiply(self.base, transpose_other=True)
         MatrixView.to_end(householder_mat, (0, 0)).scale_add(update, -2)
         return householder_mat
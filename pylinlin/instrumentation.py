@@ -0,0 +1,251 @@
+"""Opt-in instrumentation of the algorithms.
+
+Records per-phase wall time, iteration counters, flop estimates and the
+number of matrices allocated or copied while an `instrument` block is
+active. When no block is active each hook is a single context variable
+lookup, so the overhead is negligible.
+
+Sessions are tracked per context, so concurrent threads or asyncio tasks
+each only see their own work.
+
+With memory=True, tracemalloc is also used to record the peak number of
+bytes allocated within each phase. This is much slower, so it is meant for
+profiling runs and allocation budget tests rather than production.
+
+    Typical usage example:
+
+    from pylinlin.instrumentation import instrument
+
+    with instrument() as session:
+        compute_svd(matrix)
+    session.phases["svd.bidiagonal_svd"].seconds
+    session.counters["svd.sweeps"]
+    session.as_dict()
+
+    with instrument(memory=True) as session:
+        compute_qr_factorization(matrix)
+    session.peak_bytes
+    session.phases["qr.accumulate_q"].peak_bytes
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Callable, Dict, List
+import json
+import tracemalloc
+
+
+class PhaseStats:
+    """Accumulated statistics of one named phase."""
+
+    def __init__(self: PhaseStats):
+        self.calls = 0
+        self.seconds = 0.0
+        self.flops = 0
+        self.allocations = 0
+        self.peak_bytes = 0
+
+    def as_dict(self: PhaseStats) -> dict:
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "flops": self.flops,
+            "allocations": self.allocations,
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+class Session:
+    """Statistics collected within an `instrument` block.
+
+    Attributes
+    ----------
+    phases : Dict[str, PhaseStats]
+        Wall time, number of calls and estimated flops of each phase.
+        Times of nested phases are included in the enclosing phase.
+
+    counters : Dict[str, int]
+        Event counts, such as iterations of the algorithms.
+
+    flops : int
+        Total estimated floating point operations.
+
+    allocations : int
+        Number of Matrix objects created.
+
+    copies : int
+        Number of calls to Matrix.copy.
+
+    peak_bytes : int
+        Peak memory allocated above the level at the start of the session.
+        Only measured if memory profiling is enabled.
+    """
+
+    def __init__(self: Session, callback: Callable[[str, str, float], None] = None,
+                 memory: bool = False):
+        self.phases: Dict[str, PhaseStats] = {}
+        self.counters: Dict[str, int] = {}
+        self.flops = 0
+        self.allocations = 0
+        self.copies = 0
+        self.peak_bytes = 0
+        self.memory = memory
+        self.callback = callback
+        self._phase_stack: List[PhaseStats] = []
+        # [bytes traced on entry, highest bytes traced so far] of each open phase
+        self._memory_stack: List[List[int]] = []
+
+    def _enter_memory_frame(self: Session):
+        current, peak = tracemalloc.get_traced_memory()
+        if self._memory_stack:
+            parent = self._memory_stack[-1]
+            parent[1] = max(parent[1], peak)
+        _reset_peak()
+        self._memory_stack.append([current, current])
+
+    def _exit_memory_frame(self: Session) -> int:
+        # Returns the peak bytes allocated within the frame
+        _, peak = tracemalloc.get_traced_memory()
+        start, highest = self._memory_stack.pop()
+        highest = max(highest, peak)
+        if self._memory_stack:
+            parent = self._memory_stack[-1]
+            parent[1] = max(parent[1], highest)
+        _reset_peak()
+        return highest - start
+
+    def as_dict(self: Session) -> dict:
+        return {
+            "phases": {name: stats.as_dict() for name, stats in self.phases.items()},
+            "counters": dict(self.counters),
+            "flops": self.flops,
+            "allocations": self.allocations,
+            "copies": self.copies,
+            "peak_bytes": self.peak_bytes,
+        }
+
+    def to_json(self: Session) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+
+_session: ContextVar = ContextVar("pylinlin_instrumentation_session", default=None)
+
+
+def _reset_peak():
+    # tracemalloc.reset_peak is only available from Python 3.9. Without it
+    # the peaks of later phases are upper bounds including earlier phases.
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+
+
+@contextmanager
+def instrument(callback: Callable[[str, str, float], None] = None, memory: bool = False):
+    """Collects statistics of the algorithms run inside the block.
+
+    Parameters
+    ----------
+    callback : Callable[[str, str, float], None]
+        Optional hook called as callback("phase", name, seconds) when a phase
+        ends and callback("count", name, total) when a counter is incremented.
+
+    memory : bool
+        Whether to measure peak memory of each phase with tracemalloc.
+        Tracing is started if needed and stopped again at the end of the block.
+
+    Yields
+    ------
+    Session
+        The statistics, updated as the algorithms run.
+    """
+    session = Session(callback, memory)
+    started_tracing = False
+    if memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        session._enter_memory_frame()
+    token = _session.set(session)
+    try:
+        yield session
+    finally:
+        _session.reset(token)
+        if memory:
+            session.peak_bytes = session._exit_memory_frame()
+            if started_tracing:
+                tracemalloc.stop()
+
+
+def measure_peak_memory(func: Callable, *args, **kwargs) -> int:
+    """Runs func(*args, **kwargs) and returns the peak bytes it allocated."""
+    with instrument(memory=True) as session:
+        func(*args, **kwargs)
+    return session.peak_bytes
+
+
+def current_session() -> Session:
+    """Get the active session, or None if instrumentation is disabled."""
+    return _session.get()
+
+
+@contextmanager
+def phase(name: str):
+    """Times the enclosed block as the named phase, if instrumentation is enabled."""
+    session = _session.get()
+    if session is None:
+        yield
+        return
+    stats = session.phases.get(name)
+    if stats is None:
+        stats = session.phases[name] = PhaseStats()
+    stats.calls += 1
+    session._phase_stack.append(stats)
+    allocations_start = session.allocations
+    if session.memory:
+        session._enter_memory_frame()
+    time_start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - time_start
+        stats.seconds += elapsed
+        stats.allocations += session.allocations - allocations_start
+        if session.memory:
+            stats.peak_bytes = max(stats.peak_bytes, session._exit_memory_frame())
+        session._phase_stack.pop()
+        if session.callback is not None:
+            session.callback("phase", name, elapsed)
+
+
+def count(name: str, amount: int = 1):
+    """Increments the named counter, if instrumentation is enabled."""
+    session = _session.get()
+    if session is None:
+        return
+    total = session.counters.get(name, 0) + amount
+    session.counters[name] = total
+    if session.callback is not None:
+        session.callback("count", name, total)
+
+
+def add_flops(amount: int):
+    """Adds to the flop estimate of the innermost phase, if instrumentation is enabled."""
+    session = _session.get()
+    if session is None:
+        return
+    session.flops += amount
+    if session._phase_stack:
+        session._phase_stack[-1].flops += amount
+
+
+def record_allocation():
+    session = _session.get()
+    if session is not None:
+        session.allocations += 1
+
+
+def record_copy():
+    session = _session.get()
+    if session is not None:
+        session.copies += 1
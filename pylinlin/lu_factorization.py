@@ -1,7 +1,12 @@
+from typing import List
 from .matrix import Matrix
 from .matrix_view import MatrixView
+from .sparse_matrix import SparseMatrix
+from .instrumentation import phase, count, add_flops
+import heapq
 
 
+@phase("lu")
 def compute_lu_factorization(mat: Matrix) -> (Matrix, Matrix):
     # do not overwrite original matrix
     mat = mat.copy()
@@ -11,6 +16,9 @@ def compute_lu_factorization(mat: Matrix) -> (Matrix, Matrix):
     iterations = min(mat.num_rows(), mat.num_cols())
 
     for iteration in range(iterations):
+        count("lu.iterations")
+        # division of l21 and rank-one update of A22
+        add_flops((mat.num_rows() - iteration - 1) * (2 * (mat.num_cols() - iteration - 1) + 1))
 
         pivot = mat.get(iteration, iteration)
 
@@ -72,3 +80,110 @@ def compute_lu_factorization(mat: Matrix) -> (Matrix, Matrix):
             )
 
     return mat_l, mat_u
+
+
+def compute_column_ordering(mat: SparseMatrix, ordering: str = "colcount") -> List[int]:
+    if ordering == "natural":
+        return list(range(mat.num_cols()))
+    if ordering == "colcount":
+        # Static fill-reducing heuristic: eliminate the sparsest columns first
+        counts = [mat.col_ptrs[j + 1] - mat.col_ptrs[j] for j in range(mat.num_cols())]
+        return sorted(range(mat.num_cols()), key=lambda j: counts[j])
+    raise ValueError(f"Unknown column ordering: {ordering}")
+
+
+@phase("sparse_lu")
+def compute_sparse_lu_factorization(
+        mat: SparseMatrix, ordering: str = "colcount") -> (SparseMatrix, SparseMatrix, List[int], List[int]):
+    # Left-looking sparse LU with partial pivoting.
+    # Returns L, U, row_perm, col_perm with mat[row_perm[i], col_perm[j]] = (LU)[i, j]
+    if mat.num_rows() != mat.num_cols():
+        raise ValueError("Matrix should be square")
+    dims = mat.num_rows()
+    col_perm = compute_column_ordering(mat, ordering)
+    row_perm = []  # row_perm[k] is the row chosen as pivot at step k
+    pivot_step = [-1] * dims  # inverse of row_perm for pivoted rows
+    l_cols = []  # entries of L below the diagonal, keyed by original row
+    u_cols = []  # entries of U, keyed by step
+
+    for step in range(dims):
+        count("sparse_lu.iterations")
+        x = mat.get_sparse_col(col_perm[step])
+        # Sparse triangular solve with the columns of L computed so far.
+        # Eliminations only flow from earlier steps to later ones,
+        # so a heap of pending steps visits them in a valid order.
+        pending = [pivot_step[row] for row in x if pivot_step[row] >= 0]
+        heapq.heapify(pending)
+        visited = set(pending)
+        while pending:
+            k = heapq.heappop(pending)
+            multiplier = x.get(row_perm[k], 0)
+            if multiplier == 0:
+                continue
+            for row, value in l_cols[k].items():
+                x[row] = x.get(row, 0) - value * multiplier
+                later = pivot_step[row]
+                if later >= 0 and later not in visited:
+                    visited.add(later)
+                    heapq.heappush(pending, later)
+
+        u_col = {pivot_step[row]: value for row, value in x.items()
+                 if pivot_step[row] >= 0 and value != 0}
+        candidates = {row: value for row, value in x.items() if pivot_step[row] < 0}
+        pivot_row = max(candidates, key=lambda row: (abs(candidates[row]), -row), default=None)
+        if pivot_row is None or candidates[pivot_row] == 0:
+            raise ValueError("Matrix is singular")
+        pivot = candidates.pop(pivot_row)
+        u_col[step] = pivot
+        u_cols.append(u_col)
+        row_perm.append(pivot_row)
+        pivot_step[pivot_row] = step
+        l_cols.append({row: value / pivot for row, value in candidates.items() if value != 0})
+
+    # Renumber the rows of L by the step at which they were pivoted
+    l_dicts = []
+    for step, l_col in enumerate(l_cols):
+        col = {pivot_step[row]: value for row, value in l_col.items()}
+        col[step] = 1
+        l_dicts.append(col)
+    mat_l = SparseMatrix.from_column_dicts(dims, l_dicts)
+    mat_u = SparseMatrix.from_column_dicts(dims, u_cols)
+    return mat_l, mat_u, row_perm, col_perm
+
+
+def solve_sparse_lu_factorization(
+        mat_l: SparseMatrix, mat_u: SparseMatrix,
+        row_perm: List[int], col_perm: List[int], vector: List[float]) -> List[float]:
+    dims = mat_l.num_rows()
+    if len(vector) != dims:
+        raise ValueError(
+            f"Incompatible sizes for solving: {mat_l.size()} and {len(vector)}")
+    # forward substitution with unit lower triangular L
+    y = [vector[row] for row in row_perm]
+    for col in range(dims):
+        if y[col] == 0:
+            continue
+        for pos in range(mat_l.col_ptrs[col], mat_l.col_ptrs[col + 1]):
+            row = mat_l.row_indices[pos]
+            if row > col:
+                y[row] -= mat_l.values[pos] * y[col]
+    # backward substitution with upper triangular U
+    for col in range(dims - 1, -1, -1):
+        start, end = mat_u.col_ptrs[col], mat_u.col_ptrs[col + 1]
+        diagonal = 0
+        for pos in range(start, end):
+            if mat_u.row_indices[pos] == col:
+                diagonal = mat_u.values[pos]
+        if diagonal == 0:
+            raise ValueError("Matrix is singular")
+        y[col] /= diagonal
+        if y[col] == 0:
+            continue
+        for pos in range(start, end):
+            row = mat_u.row_indices[pos]
+            if row < col:
+                y[row] -= mat_u.values[pos] * y[col]
+    result = [0] * dims
+    for step, col in enumerate(col_perm):
+        result[col] = y[step]
+    return result
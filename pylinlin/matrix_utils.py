@@ -6,7 +6,7 @@ import pytest
 def assert_orthonormal(mat: Matrix):
     assert_square(mat)
     # qTq should be the identity
-    qTq = mat.transpose().multiply(mat)
+    qTq = mat.multiply(mat, transpose_self=True)
     for index, col in enumerate(qTq.all_cols()):
         for elem in col[:index]:
             assert elem == pytest.approx(0)
@@ -1,6 +1,7 @@
 from pylinlin.matrix import Matrix
 from pylinlin.matrix_view import MatrixView
 from pylinlin.householder import Householder
+from pylinlin.instrumentation import phase, count, add_flops
 
 
 def compute_qr_factorization(mat: Matrix) -> (Matrix, Matrix):
@@ -8,14 +9,19 @@ def compute_qr_factorization(mat: Matrix) -> (Matrix, Matrix):
     mat = mat.copy()
     householders = []  # store householder transformations
     iterations = min(mat.num_rows(), mat.num_cols())
-    for iteration in range(iterations):
-        col = mat.get_col(iteration)
-        # Zero out the entries below the diagonal
-        hh = Householder(col[iteration:])
-        householders.append((iteration, hh))
-        mat = hh.multiply_left(mat, pad_top=iteration)
+    with phase("qr.factorize"):
+        for iteration in range(iterations):
+            count("qr.iterations")
+            col = mat.get_col(iteration)
+            # Zero out the entries below the diagonal
+            hh = Householder(col[iteration:])
+            householders.append((iteration, hh))
+            mat = hh.multiply_left(mat, pad_top=iteration)
+            add_flops(4 * (mat.num_rows() - iteration) * mat.num_cols())
     # Accumulate the householder transformations
-    q_mat = Matrix.identity(mat.num_rows())
-    for iteration, hh in householders[::-1]:
-        q_mat = hh.multiply_left(q_mat, pad_top=iteration)
+    with phase("qr.accumulate_q"):
+        q_mat = Matrix.identity(mat.num_rows())
+        for iteration, hh in householders[::-1]:
+            q_mat = hh.multiply_left(q_mat, pad_top=iteration)
+            add_flops(4 * (mat.num_rows() - iteration) * mat.num_rows())
     return (q_mat, mat)
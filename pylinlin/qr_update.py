@@ -0,0 +1,118 @@
+from pylinlin.matrix import Matrix
+from pylinlin.givens import Givens
+from typing import List
+
+
+# Updates of a full QR factorization A = QR, with Q of size m x m and R of
+# size m x n, as returned by compute_qr_factorization. Each update restores
+# R to upper triangular form with O(m + n) givens rotations applied in
+# place, instead of refactoring A from scratch.
+
+
+def rotate(q: Matrix, r: Matrix, givens: Givens, row1: int, row2: int):
+    # QR = (Q G^T)(G R)
+    givens.apply_left_inplace(r, row1, row2)
+    givens.transpose().apply_right_inplace(q, row1, row2)
+
+
+def retriangularize_hessenberg(q: Matrix, r: Matrix, start: int = 0):
+    # Zero out the subdiagonal of R from column start onwards
+    for col in range(start, min(r.num_rows() - 1, r.num_cols())):
+        column = r.get_col(col)
+        if column[col + 1] == 0:
+            continue
+        rotate(q, r, Givens(column[col], column[col + 1]), col, col + 1)
+
+
+def qr_insert_row(q: Matrix, r: Matrix, row: List[float], index: int) -> (Matrix, Matrix):
+    # Factorize A with row inserted before row index
+    num_rows, num_cols = r.size()
+    if len(row) != num_cols:
+        raise ValueError("Row has the wrong dimension")
+    if index < 0 or index > num_rows:
+        raise ValueError("Index out of bounds")
+    # [row; A] = [[1, 0], [0, Q]] [row; R], where [row; R] is upper hessenberg
+    r = Matrix.from_cols([[elem] + col for elem, col in zip(row, r.all_cols())])
+    q = Matrix.from_cols(
+        [[1] + [0] * num_rows] + [[0] + list(col) for col in q.all_cols()])
+    retriangularize_hessenberg(q, r)
+    # move the first row of Q to the position of the inserted row
+    cols = [col[1:index + 1] + col[:1] + col[index + 1:] for col in q.all_cols()]
+    return Matrix.from_cols(cols), r
+
+
+def qr_delete_row(q: Matrix, r: Matrix, index: int) -> (Matrix, Matrix):
+    # Factorize A with row index removed
+    num_rows = r.num_rows()
+    if index < 0 or index >= num_rows:
+        raise ValueError("Index out of bounds")
+    if num_rows == 1:
+        raise ValueError("Cannot delete the only row")
+    # move the row to be deleted to the top
+    q = Matrix.from_cols([col[index:index + 1] + col[:index] + col[index + 1:] for col in q.all_cols()])
+    r = r.copy()
+    # rotate the first row of Q onto e0, which makes R upper hessenberg
+    for col in range(num_rows - 2, -1, -1):
+        top_row = q.get_row(0)
+        rotate(q, r, Givens(top_row[col], top_row[col + 1]), col, col + 1)
+    # the first row and column of Q are now +-e0, so they can be dropped
+    # along with the first row of R, which leaves R upper triangular
+    q = Matrix.from_cols([col[1:] for col in q.all_cols()[1:]])
+    r = Matrix.from_cols([col[1:] for col in r.all_cols()])
+    return q, r
+
+
+def qr_insert_col(q: Matrix, r: Matrix, col: List[float], index: int) -> (Matrix, Matrix):
+    # Factorize A with col inserted before column index
+    num_rows, num_cols = r.size()
+    if len(col) != num_rows:
+        raise ValueError("Column has the wrong dimension")
+    if index < 0 or index > num_cols:
+        raise ValueError("Index out of bounds")
+    projected = q.multiply(Matrix.from_cols([list(col)]), transpose_self=True).get_col(0)
+    cols = [col[:] for col in r.all_cols()]
+    r = Matrix.from_cols(cols[:index] + [projected] + cols[index:])
+    q = q.copy()
+    # zero the new column below the diagonal from the bottom up
+    for row in range(num_rows - 1, index, -1):
+        column = r.get_col(index)
+        if column[row] == 0:
+            continue
+        rotate(q, r, Givens(column[row - 1], column[row]), row - 1, row)
+    return q, r
+
+
+def qr_delete_col(q: Matrix, r: Matrix, index: int) -> (Matrix, Matrix):
+    # Factorize A with column index removed
+    num_cols = r.num_cols()
+    if index < 0 or index >= num_cols:
+        raise ValueError("Index out of bounds")
+    if num_cols == 1:
+        raise ValueError("Cannot delete the only column")
+    cols = [col[:] for col in r.all_cols()]
+    r = Matrix.from_cols(cols[:index] + cols[index + 1:])
+    q = q.copy()
+    # columns after index are shifted left, leaving R upper hessenberg
+    retriangularize_hessenberg(q, r, index)
+    return q, r
+
+
+def qr_rank_one_update(q: Matrix, r: Matrix, u: List[float], v: List[float]) -> (Matrix, Matrix):
+    # Factorize A + u v^T
+    num_rows, num_cols = r.size()
+    if len(u) != num_rows or len(v) != num_cols:
+        raise ValueError("Vectors have the wrong dimensions")
+    # A + u v^T = Q (R + w v^T) with w = Q^T u
+    w = q.multiply(Matrix.from_cols([list(u)]), transpose_self=True).get_col(0)
+    q = q.copy()
+    r = r.copy()
+    # rotate w onto a multiple of e0 from the bottom up, which makes R upper hessenberg
+    for row in range(num_rows - 2, -1, -1):
+        givens = Givens(w[row], w[row + 1])
+        w[row], w[row + 1] = givens.x1 * w[row] + givens.x2 * w[row + 1], 0
+        rotate(q, r, givens, row, row + 1)
+    # R + w[0] e0 v^T is still upper hessenberg
+    for col, elem in zip(r.all_cols(), v):
+        col[0] += w[0] * elem
+    retriangularize_hessenberg(q, r)
+    return q, r
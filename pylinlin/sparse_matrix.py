@@ -0,0 +1,295 @@
+"""Compressed sparse column matrices.
+
+Stores only the nonzero entries of a matrix, column by column. This is the
+representation to use for matrices that are mostly zeroes, such as banded
+or bidiagonal systems, which would be too large to store densely.
+
+    Typical usage example:
+
+    from pylinlin.sparse_matrix import SparseMatrix
+
+    sparse = SparseMatrix.from_triplets(3, 3, [(0, 0, 2), (1, 1, 3), (2, 0, 1)])
+    sparse.multiply_column([1, 1, 1])  # [2, 3, 1]
+    dense = sparse.to_matrix()
+"""
+
+from __future__ import annotations
+from typing import List, Tuple
+from .matrix import Matrix
+
+
+class SparseMatrix:
+    """A matrix in compressed sparse column (CSC) format.
+
+    Column j holds the entries values[col_ptrs[j]:col_ptrs[j + 1]], found in
+    rows row_indices[col_ptrs[j]:col_ptrs[j + 1]] in increasing order.
+    """
+
+    @staticmethod
+    def from_triplets(num_rows: int, num_cols: int,
+                      triplets: List[Tuple[int, int, float]]) -> SparseMatrix:
+        """Initializes a sparse matrix from (row, col, value) triplets.
+
+        Duplicate entries are summed and explicit zeroes are dropped.
+
+        Parameters
+        ----------
+        num_rows : int
+            Number of rows in the matrix.
+
+        num_cols : int
+            Number of columns in the matrix.
+
+        triplets : List[Tuple[int, int, float]]
+            The nonzero entries of the matrix.
+
+        Raises
+        ------
+        ValueError
+            If any of the indices are outside the bounds of the matrix.
+        """
+        columns = [{} for _ in range(num_cols)]
+        for row, col, value in triplets:
+            if row < 0 or row >= num_rows or col < 0 or col >= num_cols:
+                raise ValueError("Index out of bounds")
+            columns[col][row] = columns[col].get(row, 0) + value
+        return SparseMatrix.from_column_dicts(num_rows, columns)
+
+    @staticmethod
+    def from_column_dicts(num_rows: int, columns: List[dict]) -> SparseMatrix:
+        """Initializes a sparse matrix from one {row: value} dict per column.
+
+        Parameters
+        ----------
+        num_rows : int
+            Number of rows in the matrix.
+
+        columns : List[dict]
+            The nonzero entries of each column, keyed by row index.
+        """
+        col_ptrs = [0]
+        row_indices = []
+        values = []
+        for col in columns:
+            for row in sorted(col):
+                if col[row] != 0:
+                    row_indices.append(row)
+                    values.append(col[row])
+            col_ptrs.append(len(values))
+        return SparseMatrix(num_rows, len(columns), col_ptrs, row_indices, values)
+
+    @staticmethod
+    def from_matrix(mat: Matrix) -> SparseMatrix:
+        """Converts a dense matrix into a sparse matrix, dropping its zeroes.
+
+        Parameters
+        ----------
+        mat : Matrix
+            The dense matrix.
+        """
+        columns = [{row: elem for row, elem in enumerate(col) if elem != 0}
+                   for col in mat.all_cols()]
+        return SparseMatrix.from_column_dicts(mat.num_rows(), columns)
+
+    @staticmethod
+    def identity(dims: int) -> SparseMatrix:
+        """Initializes a square sparse identity matrix.
+
+        Parameters
+        ----------
+        dims : int
+            The number of rows and columns of the matrix.
+        """
+        return SparseMatrix(dims, dims, list(range(dims + 1)), list(range(dims)), [1] * dims)
+
+    def __init__(self: SparseMatrix, num_rows: int, num_cols: int,
+                 col_ptrs: List[int], row_indices: List[int], values: List[float]):
+        """Initializes a sparse matrix from its CSC arrays.
+
+        Parameters
+        ----------
+        num_rows : int
+            Number of rows in the matrix.
+
+        num_cols : int
+            Number of columns in the matrix.
+
+        col_ptrs : List[int]
+            Offsets of the start of each column, of length num_cols + 1.
+
+        row_indices : List[int]
+            Row index of each stored entry.
+
+        values : List[float]
+            Value of each stored entry.
+
+        Raises
+        ------
+        ValueError
+            If the arrays are inconsistent with each other or the dimensions.
+        """
+        if len(col_ptrs) != num_cols + 1 or col_ptrs[0] != 0:
+            raise ValueError("Column pointers must have length num_cols + 1 and start at 0")
+        if len(row_indices) != len(values) or col_ptrs[-1] != len(values):
+            raise ValueError("Row indices and values must have one entry per nonzero")
+        self._num_rows = num_rows
+        self._num_cols = num_cols
+        self.col_ptrs = col_ptrs
+        self.row_indices = row_indices
+        self.values = values
+
+    def size(self: SparseMatrix) -> (int, int):
+        """Get the dimensions of the matrix as (number of rows, number of columns)."""
+        return (self._num_rows, self._num_cols)
+
+    def num_rows(self: SparseMatrix) -> int:
+        """Get the number of rows in the matrix."""
+        return self._num_rows
+
+    def num_cols(self: SparseMatrix) -> int:
+        """Get the number of columns in the matrix."""
+        return self._num_cols
+
+    def num_nonzeros(self: SparseMatrix) -> int:
+        """Get the number of stored entries in the matrix."""
+        return len(self.values)
+
+    def copy(self: SparseMatrix) -> SparseMatrix:
+        """Makes a copy of the matrix. Mutating the copy should not affect the original."""
+        return SparseMatrix(self._num_rows, self._num_cols, self.col_ptrs[:],
+                            self.row_indices[:], self.values[:])
+
+    def get_sparse_col(self: SparseMatrix, index: int) -> dict:
+        """Extracts the nonzero entries of a column as a {row: value} dict.
+
+        Raises
+        ------
+        ValueError
+            If the index given is outside the bounds of the matrix.
+        """
+        if index < 0 or index >= self._num_cols:
+            raise ValueError("Index out of bounds")
+        start, end = self.col_ptrs[index], self.col_ptrs[index + 1]
+        return dict(zip(self.row_indices[start:end], self.values[start:end]))
+
+    def get_col(self: SparseMatrix, index: int) -> List[float]:
+        """Extracts a column of the matrix as a dense list.
+
+        Raises
+        ------
+        ValueError
+            If the index given is outside the bounds of the matrix.
+        """
+        col = [0] * self._num_rows
+        for row, value in self.get_sparse_col(index).items():
+            col[row] = value
+        return col
+
+    def get(self: SparseMatrix, row: int, col: int) -> float:
+        """Extracts an element of the matrix.
+
+        Raises
+        ------
+        ValueError
+            If either of the indices given are outside the bounds of the matrix.
+        """
+        if row < 0 or row >= self._num_rows:
+            raise ValueError("Index out of bounds")
+        return self.get_sparse_col(col).get(row, 0)
+
+    def to_matrix(self: SparseMatrix) -> Matrix:
+        """Converts the sparse matrix into a dense matrix."""
+        return Matrix.from_cols([self.get_col(index) for index in range(self._num_cols)])
+
+    def transpose(self: SparseMatrix) -> SparseMatrix:
+        """Computes the transpose of the matrix, which is again in CSC format."""
+        counts = [0] * (self._num_rows + 1)
+        for row in self.row_indices:
+            counts[row + 1] += 1
+        for index in range(self._num_rows):
+            counts[index + 1] += counts[index]
+        col_ptrs = counts[:]
+        row_indices = [0] * len(self.values)
+        values = [0] * len(self.values)
+        for col in range(self._num_cols):
+            for pos in range(self.col_ptrs[col], self.col_ptrs[col + 1]):
+                dest = counts[self.row_indices[pos]]
+                row_indices[dest] = col
+                values[dest] = self.values[pos]
+                counts[self.row_indices[pos]] += 1
+        return SparseMatrix(self._num_cols, self._num_rows, col_ptrs, row_indices, values)
+
+    def multiply_column(self: SparseMatrix, vector: List[float]) -> List[float]:
+        """Computes a sparse matrix-vector product, touching only the stored entries.
+
+        Parameters
+        ----------
+        vector : List[float]
+            The vector to be multiplied.
+
+        Returns
+        -------
+        List[float]
+            The product as a dense vector.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the matrix does not match the dimension of the vector
+        """
+        if self._num_cols != len(vector):
+            raise ValueError(
+                f"Incompatible sizes for multiplication: {self.size()} and {len(vector)}")
+        result = [0] * self._num_rows
+        row_indices = self.row_indices
+        values = self.values
+        for col, multiplier in enumerate(vector):
+            if multiplier == 0:
+                continue
+            for pos in range(self.col_ptrs[col], self.col_ptrs[col + 1]):
+                result[row_indices[pos]] += values[pos] * multiplier
+        return result
+
+    def multiply_column_transposed(self: SparseMatrix, vector: List[float]) -> List[float]:
+        """Computes the product of the transpose of this matrix with a vector.
+
+        Raises
+        ------
+        ValueError
+            If the number of rows of the matrix does not match the dimension of the vector
+        """
+        if self._num_rows != len(vector):
+            raise ValueError(
+                f"Incompatible sizes for multiplication: {self.size()} and {len(vector)}")
+        result = [0] * self._num_cols
+        row_indices = self.row_indices
+        values = self.values
+        for col in range(self._num_cols):
+            total = 0
+            for pos in range(self.col_ptrs[col], self.col_ptrs[col + 1]):
+                total += values[pos] * vector[row_indices[pos]]
+            result[col] = total
+        return result
+
+    def multiply(self: SparseMatrix, other: Matrix) -> Matrix:
+        """Multiplies this sparse matrix with a dense matrix.
+
+        Parameters
+        ----------
+        other : Matrix
+            The right hand side of the product.
+
+        Returns
+        -------
+        Matrix
+            The dense product.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of this matrix does not match the number of rows of the right hand side.
+        """
+        if self._num_cols != other.num_rows():
+            raise ValueError(
+                f"Incompatible matrix sizes for multiplication: {self.size()} and {other.size()}")
+        return Matrix.from_cols([self.multiply_column(col) for col in other.all_cols()])
@@ -0,0 +1,434 @@
+"""Matrices with a known structure of zeroes.
+
+Contains banded, triangular and diagonal matrices. Each stores only the
+entries inside its band, column by column, and its kernels skip the
+structural zeroes. For example multiplying by a diagonal matrix is O(n^2)
+rather than the O(n^3) of a dense multiplication.
+
+    Typical usage example:
+
+    from pylinlin.structured_matrix import DiagonalMatrix, TriangularMatrix
+
+    u, s, v = compute_svd(matrix)
+    s = DiagonalMatrix.from_matrix(s)
+    product = s.multiply_right(u).multiply(v, transpose_other=True)
+
+    l, u = compute_lu_factorization(matrix)
+    y = TriangularMatrix.from_matrix(l, lower=True).solve(b)
+    x = TriangularMatrix.from_matrix(u, lower=False).solve(y)
+"""
+
+from __future__ import annotations
+from typing import List
+from .matrix import Matrix
+
+
+class BandedMatrix:
+    """A matrix whose nonzero entries lie within a band around the diagonal.
+
+    Entry (i, j) may be nonzero only if j - upper_bandwidth <= i <= j + lower_bandwidth.
+    Column j stores the entries of rows row_range(j) in order.
+    """
+
+    @staticmethod
+    def from_matrix(mat: Matrix, lower_bandwidth: int, upper_bandwidth: int) -> BandedMatrix:
+        """Extracts the band of a dense matrix. Entries outside the band are discarded.
+
+        Parameters
+        ----------
+        mat : Matrix
+            The dense matrix.
+
+        lower_bandwidth : int
+            Number of nonzero subdiagonals.
+
+        upper_bandwidth : int
+            Number of nonzero superdiagonals.
+        """
+        band = BandedMatrix(mat.num_rows(), mat.num_cols(), lower_bandwidth, upper_bandwidth)
+        band._fill_from(mat)
+        return band
+
+    def __init__(self: BandedMatrix, num_rows: int, num_cols: int,
+                 lower_bandwidth: int, upper_bandwidth: int, columns: List[List[float]] = None):
+        """Initializes a banded matrix.
+
+        Parameters
+        ----------
+        num_rows : int
+            Number of rows in the matrix.
+
+        num_cols : int
+            Number of columns in the matrix.
+
+        lower_bandwidth : int
+            Number of nonzero subdiagonals.
+
+        upper_bandwidth : int
+            Number of nonzero superdiagonals.
+
+        columns : List[List[float]]
+            The entries of each column within the band. Defaults to zeroes.
+
+        Raises
+        ------
+        ValueError
+            If the bandwidths are negative or a column has the wrong length.
+        """
+        if lower_bandwidth < 0 or upper_bandwidth < 0:
+            raise ValueError("Bandwidths must be non-negative")
+        self._num_rows = num_rows
+        self._num_cols = num_cols
+        self.lower_bandwidth = lower_bandwidth
+        self.upper_bandwidth = upper_bandwidth
+        if columns is None:
+            columns = []
+            for col in range(num_cols):
+                start, end = self.row_range(col)
+                columns.append([0] * (end - start))
+        if len(columns) != num_cols:
+            raise ValueError("Number of columns does not match the dimensions")
+        for col, values in enumerate(columns):
+            start, end = self.row_range(col)
+            if len(values) != end - start:
+                raise ValueError("Column length does not match the band")
+        self.columns = columns
+
+    def _fill_from(self: BandedMatrix, mat: Matrix):
+        for col, values in enumerate(mat.all_cols()):
+            start, end = self.row_range(col)
+            self.columns[col] = list(values[start:end])
+
+    def row_range(self: BandedMatrix, col: int) -> (int, int):
+        """Get the rows [start, end) of the band in the given column."""
+        start = max(0, col - self.upper_bandwidth)
+        end = min(self._num_rows, col + self.lower_bandwidth + 1)
+        return (start, max(start, end))
+
+    def size(self: BandedMatrix) -> (int, int):
+        """Get the dimensions of the matrix as (number of rows, number of columns)."""
+        return (self._num_rows, self._num_cols)
+
+    def num_rows(self: BandedMatrix) -> int:
+        """Get the number of rows in the matrix."""
+        return self._num_rows
+
+    def num_cols(self: BandedMatrix) -> int:
+        """Get the number of columns in the matrix."""
+        return self._num_cols
+
+    def get(self: BandedMatrix, row: int, col: int) -> float:
+        """Extracts an element of the matrix.
+
+        Raises
+        ------
+        ValueError
+            If either of the indices given are outside the bounds of the matrix.
+        """
+        if row < 0 or row >= self._num_rows:
+            raise ValueError("Index out of bounds")
+        if col < 0 or col >= self._num_cols:
+            raise ValueError("Index out of bounds")
+        start, end = self.row_range(col)
+        if row < start or row >= end:
+            return 0
+        return self.columns[col][row - start]
+
+    def get_col(self: BandedMatrix, index: int) -> List[float]:
+        """Extracts a column of the matrix as a dense list.
+
+        Raises
+        ------
+        ValueError
+            If the index given is outside the bounds of the matrix.
+        """
+        if index < 0 or index >= self._num_cols:
+            raise ValueError("Index out of bounds")
+        start, end = self.row_range(index)
+        return [0] * start + self.columns[index] + [0] * (self._num_rows - end)
+
+    def to_matrix(self: BandedMatrix) -> Matrix:
+        """Converts the structured matrix into a dense matrix."""
+        return Matrix.from_cols([self.get_col(index) for index in range(self._num_cols)])
+
+    def _transposed_columns(self: BandedMatrix) -> List[List[float]]:
+        # column i of the transpose is row i of this matrix, restricted to the band
+        columns = []
+        for row in range(self._num_rows):
+            start = max(0, row - self.lower_bandwidth)
+            end = min(self._num_cols, row + self.upper_bandwidth + 1)
+            columns.append([self.get(row, col) for col in range(start, end)])
+        return columns
+
+    def transpose(self: BandedMatrix) -> BandedMatrix:
+        """Computes the transpose, swapping the lower and upper bandwidths."""
+        return BandedMatrix(self._num_cols, self._num_rows, self.upper_bandwidth,
+                            self.lower_bandwidth, self._transposed_columns())
+
+    def multiply_column(self: BandedMatrix, vector: List[float]) -> List[float]:
+        """Computes a matrix-vector product, touching only the entries in the band.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the matrix does not match the dimension of the vector
+        """
+        if self._num_cols != len(vector):
+            raise ValueError(
+                f"Incompatible sizes for multiplication: {self.size()} and {len(vector)}")
+        result = [0] * self._num_rows
+        for col, multiplier in enumerate(vector):
+            if multiplier == 0:
+                continue
+            start = self.row_range(col)[0]
+            for offset, value in enumerate(self.columns[col]):
+                result[start + offset] += value * multiplier
+        return result
+
+    def multiply(self: BandedMatrix, other: Matrix) -> Matrix:
+        """Computes the product of this matrix with a dense matrix on the right.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of this matrix does not match the number of rows of the right hand side.
+        """
+        if self._num_cols != other.num_rows():
+            raise ValueError(
+                f"Incompatible matrix sizes for multiplication: {self.size()} and {other.size()}")
+        return Matrix.from_cols([self.multiply_column(col) for col in other.all_cols()])
+
+    def multiply_left(self: BandedMatrix, mat: Matrix) -> Matrix:
+        """Computes self * mat. Equivalent to multiply."""
+        return self.multiply(mat)
+
+    def multiply_right(self: BandedMatrix, mat: Matrix) -> Matrix:
+        """Computes mat * self, where mat is a dense matrix.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of mat does not match the number of rows of this matrix.
+        """
+        if mat.num_cols() != self._num_rows:
+            raise ValueError(
+                f"Incompatible matrix sizes for multiplication: {mat.size()} and {self.size()}")
+        mat_cols = mat.all_cols()
+        result = []
+        for col in range(self._num_cols):
+            start = self.row_range(col)[0]
+            acc = [0] * mat.num_rows()
+            for offset, value in enumerate(self.columns[col]):
+                if value == 0:
+                    continue
+                acc = Matrix.column_add(acc, Matrix.column_scale(mat_cols[start + offset], value))
+            result.append(acc)
+        return Matrix.from_cols(result)
+
+
+class TriangularMatrix(BandedMatrix):
+    """A lower or upper triangular (or trapezoidal) matrix."""
+
+    @staticmethod
+    def from_matrix(mat: Matrix, lower: bool) -> TriangularMatrix:
+        """Extracts the lower or upper triangle of a dense matrix.
+
+        Parameters
+        ----------
+        mat : Matrix
+            The dense matrix.
+
+        lower : bool
+            Whether to extract the lower triangle, otherwise the upper triangle.
+        """
+        triangular = TriangularMatrix(mat.num_rows(), mat.num_cols(), lower)
+        triangular._fill_from(mat)
+        return triangular
+
+    def __init__(self: TriangularMatrix, num_rows: int, num_cols: int,
+                 lower: bool, columns: List[List[float]] = None):
+        """Initializes a triangular matrix.
+
+        Parameters
+        ----------
+        num_rows : int
+            Number of rows in the matrix.
+
+        num_cols : int
+            Number of columns in the matrix.
+
+        lower : bool
+            Whether the matrix is lower triangular, otherwise upper triangular.
+
+        columns : List[List[float]]
+            The entries of each column within the triangle. Defaults to zeroes.
+        """
+        self.lower = lower
+        if lower:
+            super().__init__(num_rows, num_cols, max(num_rows - 1, 0), 0, columns)
+        else:
+            super().__init__(num_rows, num_cols, 0, max(num_cols - 1, 0), columns)
+
+    def transpose(self: TriangularMatrix) -> TriangularMatrix:
+        """Computes the transpose, which is triangular with the opposite orientation."""
+        return TriangularMatrix(self._num_cols, self._num_rows, not self.lower,
+                                self._transposed_columns())
+
+    def solve(self: TriangularMatrix, vector: List[float], transpose: bool = False) -> List[float]:
+        """Solves Tx = b by substitution, touching only the triangle.
+
+        Parameters
+        ----------
+        vector : List[float]
+            The right hand side b.
+
+        transpose : bool
+            Whether to solve with the transpose of this matrix instead.
+
+        Returns
+        -------
+        List[float]
+            The solution x.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not square, is singular, or the vector has the wrong dimension.
+        """
+        dims = self._num_rows
+        if dims != self._num_cols:
+            raise ValueError("Matrix should be square")
+        if len(vector) != dims:
+            raise ValueError(
+                f"Incompatible sizes for solving: {self.size()} and {len(vector)}")
+        x = list(vector)
+        columns = self.columns
+        if self.lower != transpose:
+            # forward substitution
+            order = range(dims)
+        else:
+            order = range(dims - 1, -1, -1)
+        for col in order:
+            values = columns[col]
+            # the diagonal is the first stored entry of a lower triangular
+            # column and the last stored entry of an upper triangular column
+            diagonal = values[0] if self.lower else values[-1]
+            if diagonal == 0:
+                raise ValueError("Matrix is singular")
+            start = self.row_range(col)[0]
+            if transpose:
+                # row col of the transpose is column col of this matrix
+                total = x[col]
+                for offset, value in enumerate(values):
+                    if start + offset != col:
+                        total -= value * x[start + offset]
+                x[col] = total / diagonal
+            else:
+                x[col] /= diagonal
+                multiplier = x[col]
+                if multiplier == 0:
+                    continue
+                for offset, value in enumerate(values):
+                    if start + offset != col:
+                        x[start + offset] -= value * multiplier
+        return x
+
+
+class DiagonalMatrix(BandedMatrix):
+    """A (possibly rectangular) diagonal matrix."""
+
+    @staticmethod
+    def from_matrix(mat: Matrix) -> DiagonalMatrix:
+        """Extracts the diagonal of a dense matrix.
+
+        Parameters
+        ----------
+        mat : Matrix
+            The dense matrix.
+        """
+        diagonal = [mat.get(i, i) for i in range(min(mat.num_rows(), mat.num_cols()))]
+        return DiagonalMatrix(diagonal, mat.num_rows(), mat.num_cols())
+
+    def __init__(self: DiagonalMatrix, diagonal: List[float],
+                 num_rows: int = None, num_cols: int = None):
+        """Initializes a diagonal matrix.
+
+        Parameters
+        ----------
+        diagonal : List[float]
+            The diagonal entries.
+
+        num_rows : int
+            Number of rows in the matrix. Defaults to the length of the diagonal.
+
+        num_cols : int
+            Number of columns in the matrix. Defaults to the length of the diagonal.
+
+        Raises
+        ------
+        ValueError
+            If the length of the diagonal does not match the dimensions.
+        """
+        num_rows = len(diagonal) if num_rows is None else num_rows
+        num_cols = len(diagonal) if num_cols is None else num_cols
+        if len(diagonal) != min(num_rows, num_cols):
+            raise ValueError("Diagonal length does not match the dimensions")
+        columns = [[elem] for elem in diagonal] + [[] for _ in range(num_cols - len(diagonal))]
+        super().__init__(num_rows, num_cols, 0, 0, columns)
+
+    def diagonal(self: DiagonalMatrix) -> List[float]:
+        """Get the diagonal entries as a list."""
+        return [col[0] for col in self.columns if col]
+
+    def transpose(self: DiagonalMatrix) -> DiagonalMatrix:
+        """Computes the transpose, which has the same diagonal."""
+        return DiagonalMatrix(self.diagonal(), self._num_cols, self._num_rows)
+
+    def multiply_column(self: DiagonalMatrix, vector: List[float]) -> List[float]:
+        """Scales each entry of the vector by the corresponding diagonal entry.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the matrix does not match the dimension of the vector
+        """
+        if self._num_cols != len(vector):
+            raise ValueError(
+                f"Incompatible sizes for multiplication: {self.size()} and {len(vector)}")
+        diagonal = self.diagonal()
+        result = [a * b for a, b in zip(diagonal, vector)]
+        return result + [0] * (self._num_rows - len(result))
+
+    def multiply_right(self: DiagonalMatrix, mat: Matrix) -> Matrix:
+        """Computes mat * self by scaling the columns of mat.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of mat does not match the number of rows of this matrix.
+        """
+        if mat.num_cols() != self._num_rows:
+            raise ValueError(
+                f"Incompatible matrix sizes for multiplication: {mat.size()} and {self.size()}")
+        diagonal = self.diagonal()
+        cols = [Matrix.column_scale(col, scale) for col, scale in zip(mat.all_cols(), diagonal)]
+        cols += [[0] * mat.num_rows() for _ in range(self._num_cols - len(diagonal))]
+        return Matrix.from_cols(cols)
+
+    def solve(self: DiagonalMatrix, vector: List[float]) -> List[float]:
+        """Solves Dx = b for a square diagonal matrix D.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not square, is singular, or the vector has the wrong dimension.
+        """
+        if self._num_rows != self._num_cols:
+            raise ValueError("Matrix should be square")
+        if len(vector) != self._num_rows:
+            raise ValueError(
+                f"Incompatible sizes for solving: {self.size()} and {len(vector)}")
+        diagonal = self.diagonal()
+        if 0 in diagonal:
+            raise ValueError("Matrix is singular")
+        return [b / d for b, d in zip(vector, diagonal)]
@@ -3,10 +3,13 @@ from pylinlin.matrix_view import MatrixView
 from pylinlin.householder import Householder
 from pylinlin.qr_factorization import compute_qr_factorization
 from pylinlin.givens import Givens
+from pylinlin.structured_matrix import DiagonalMatrix
+from pylinlin.instrumentation import phase, count, add_flops
 import pylinlin.matrix_utils as utils
 from typing import List
 
 
+@phase("svd.bidiagonalization")
 def reduce_to_bidiagonal(mat: Matrix) -> (Matrix, List[Householder], List[Householder]):
     mat = mat.copy()
     if mat.num_rows() != mat.num_cols():
@@ -20,59 +23,72 @@ def reduce_to_bidiagonal(mat: Matrix) -> (Matrix, List[Householder], List[Househ
         householder_left = Householder(col)
         mat = householder_left.multiply_left(mat, pad_top=iteration)
         acc_left.append(householder_left)
+        add_flops(4 * (mat.num_rows() - iteration) * mat.num_cols())
         if iteration != iterations - 1:
             # clear zeroes above superdiagonal
             row = mat.get_row(iteration)[iteration + 1:]
             householder_right = Householder(row)
             mat = householder_right.multiply_right(mat, pad_top=iteration + 1)
             acc_right.append(householder_right)
+            add_flops(4 * (mat.num_cols() - iteration - 1) * mat.num_rows())
     return mat, acc_left, acc_right
 
 
+@phase("svd.bidiagonal_svd")
 def compute_svd_bidiagonal(mat: Matrix) -> (Matrix, Matrix, Matrix):
     dims = mat.num_cols()
+    # rotations are applied in place, do not overwrite original matrix
+    mat = mat.copy()
     u = Matrix.identity(dims)
     v = Matrix.identity(dims)
     while True:
         # while not converged
-        # find max off-diagonal
-        max_off_diag = 0
         diag_sum = 0
-        for i in range(dims - 1):
-            max_off_diag = max(max_off_diag, abs(mat.get(i, i+1)))
         for i in range(dims):
             diag_sum += abs(mat.get(i, i))
         diag_sum /= dims
-        if max_off_diag < diag_sum * 1e-6 and max_off_diag < 1e-8:
+        # deflate: zero out negligible off-diagonal entries, which splits
+        # the matrix into independent blocks
+        for i in range(dims - 1):
+            off_diag = abs(mat.get(i, i + 1))
+            if off_diag < diag_sum * 1e-6 and off_diag < 1e-8:
+                mat.all_cols()[i + 1][i] = 0
+        # find the last unreduced block start..end
+        end = dims - 1
+        while end > 0 and mat.get(end - 1, end) == 0:
+            end -= 1
+        if end == 0:
             break
+        start = end - 1
+        while start > 0 and mat.get(start - 1, start) != 0:
+            start -= 1
+        count("svd.sweeps")
+        # each rotation updates two rows or columns of mat and of u or v
+        count("svd.givens_rotations", 2 * (end - start))
+        add_flops(2 * (end - start) * 12 * dims)
 
-        # introduce the bulge
-        givens = Givens(mat.get(0, 0) ** 2 - mat.get(dims - 1, dims - 1) ** 2 - mat.get(dims - 2, dims - 1) ** 2,
-                        mat.get(0, 1) * mat.get(0, 0)).transpose()
-        mat = givens.multiply_right(mat)
-        v = givens.transpose().multiply_left(v)
+        # introduce the bulge, shifting by the trailing entry of the block of B^T B
+        givens = Givens(mat.get(start, start) ** 2 - mat.get(end, end) ** 2 - mat.get(end - 1, end) ** 2,
+                        mat.get(start, start + 1) * mat.get(start, start)).transpose()
+        givens.apply_right_inplace(mat, start, start + 1)
+        givens.apply_right_inplace(v, start, start + 1)
 
         # chase the bulge
-        for iteration in range(0, dims - 1):
+        for iteration in range(start, end):
             # zero subdiagonal
             givens_lower = Givens(
                 mat.get(iteration, iteration),
                 mat.get(iteration + 1, iteration))
-            mat = givens_lower.multiply_left(
-                mat, pad_top=iteration)
-            u = givens_lower.transpose().multiply_right(
-                u, pad_top=iteration)
+            givens_lower.apply_left_inplace(mat, iteration, iteration + 1)
+            givens_lower.transpose().apply_right_inplace(u, iteration, iteration + 1)
             # zero above superdiagonal
-            if iteration != dims - 2:
+            if iteration != end - 1:
                 givens_upper = Givens(
                     mat.get(iteration, iteration + 1),
                     mat.get(iteration, iteration + 2)).transpose()
-                mat = givens_upper.multiply_right(
-                    mat, pad_top=iteration + 1)
-                v = givens_upper.transpose().multiply_left(
-                    v, pad_top=iteration + 1)
+                givens_upper.apply_right_inplace(mat, iteration + 1, iteration + 2)
+                givens_upper.apply_right_inplace(v, iteration + 1, iteration + 2)
 
-    v = v.transpose()
     # Ensure singular values are non-negative
     for i in range(dims):
         if mat.get(i, i) < 0:
@@ -87,11 +103,7 @@ def compute_svd_bidiagonal(mat: Matrix) -> (Matrix, Matrix, Matrix):
     sorted_u_cols = [u.get_col(index) for value, index in sv]
     v = Matrix.from_cols(sorted_v_cols)
     u = Matrix.from_cols(sorted_u_cols)
-    mat = Matrix.zeroes(dims, dims)
-    for index, (value, _) in enumerate(sv):
-        MatrixView.with_size(
-            mat, (index, index), (1, 1)
-        ).set_element(0, 0, value)
+    mat = DiagonalMatrix([value for value, _ in sv]).to_matrix()
 
     return u, mat, v
 
@@ -103,7 +115,8 @@ def compute_svd(mat: Matrix) -> (Matrix, Matrix, Matrix):
     elif mat.num_rows() > mat.num_cols():
         # mat is m x n, m > n
         # q should be m x m, r should be m x n
-        q, r = compute_qr_factorization(mat)
+        with phase("svd.qr"):
+            q, r = compute_qr_factorization(mat)
         # truncate r to be n x n, truncate q to be m x n
         r_truncated = MatrixView.with_size(
             r, (0, 0), (mat.num_cols(), mat.num_cols())).to_matrix()
@@ -112,7 +125,9 @@ def compute_svd(mat: Matrix) -> (Matrix, Matrix, Matrix):
         MatrixView.with_size(
             u_padded, (0, 0), (mat.num_cols(), mat.num_cols())
         ).set(MatrixView.whole(u))
-        u = q.multiply(u_padded)
+        with phase("svd.accumulate_u"):
+            u = q.multiply(u_padded)
+            add_flops(2 * mat.num_rows() ** 3)
         s_padded = Matrix.zeroes(mat.num_rows(), mat.num_cols())
         MatrixView.with_size(
             s_padded, (0, 0), (mat.num_cols(), mat.num_cols())
@@ -123,9 +138,13 @@ def compute_svd(mat: Matrix) -> (Matrix, Matrix, Matrix):
         # matrix is square
         b, left, right = reduce_to_bidiagonal(mat)
         u, s, v = compute_svd_bidiagonal(b)
-        for index, hh in list(enumerate(left))[::-1]:
-            u = hh.multiply_left(u, index)
-        v_transpose = v.transpose()
-        for index, hh in list(enumerate(right))[::-1]:
-            v_transpose = hh.multiply_right(v_transpose, index + 1)
-        return u, s, v_transpose.transpose()
+        with phase("svd.accumulate_u"):
+            for index, hh in list(enumerate(left))[::-1]:
+                u = hh.multiply_left(u, index)
+                add_flops(4 * (u.num_rows() - index) * u.num_cols())
+        with phase("svd.accumulate_v"):
+            # householder matrices are symmetric, so V^T H = (H V)^T
+            for index, hh in list(enumerate(right))[::-1]:
+                v = hh.multiply_left(v, index + 1)
+                add_flops(4 * (v.num_rows() - index - 1) * v.num_cols())
+        return u, s, v
@@ -0,0 +1,183 @@
+"""Incremental SVD with Brand-style rank updates.
+
+Maintains a thin, possibly truncated, SVD A = U diag(s) V^T and updates it
+when a column is appended to A or a rank-one matrix is added to A. Each
+update only needs the SVD of a small (k + 1) x (k + 1) matrix, where k is
+the current rank, rather than of the whole of A.
+
+    Typical usage example:
+
+    from pylinlin.svd_update import IncrementalSVD
+
+    svd = IncrementalSVD.from_matrix(matrix, max_rank=10)
+    svd.add_column(new_column)
+    svd.update(a, b)  # A + a b^T
+    u, s, v = svd.u, svd.singular_values, svd.v
+"""
+
+from __future__ import annotations
+from typing import List
+from pylinlin.matrix import Matrix
+from pylinlin.structured_matrix import DiagonalMatrix
+from pylinlin.svd import compute_svd
+import math
+
+
+class IncrementalSVD:
+    """A thin SVD A = U diag(s) V^T that can be updated in place.
+
+    Attributes
+    ----------
+    u : Matrix
+        The m x k matrix of left singular vectors.
+
+    singular_values : List[float]
+        The k singular values in decreasing order.
+
+    v : Matrix
+        The n x k matrix of right singular vectors.
+    """
+
+    @staticmethod
+    def from_matrix(mat: Matrix, max_rank: int = None, tol: float = 1e-10) -> IncrementalSVD:
+        """Initializes the incremental SVD from the full SVD of a matrix.
+
+        Parameters
+        ----------
+        mat : Matrix
+            The initial matrix.
+
+        max_rank : int
+            If given, only the max_rank largest singular values are kept.
+
+        tol : float
+            Singular values below tol times the largest one are dropped.
+        """
+        u, s, v = compute_svd(mat)
+        singular_values = [s.get(i, i) for i in range(min(mat.num_rows(), mat.num_cols()))]
+        return IncrementalSVD(u, singular_values, v, max_rank, tol)
+
+    def __init__(self: IncrementalSVD, u: Matrix, singular_values: List[float], v: Matrix,
+                 max_rank: int = None, tol: float = 1e-10):
+        """Initializes the incremental SVD from existing factors.
+
+        Only the first len(singular_values) columns of u and v are used, and
+        the factors are truncated according to max_rank and tol.
+
+        Raises
+        ------
+        ValueError
+            If u or v have fewer columns than there are singular values.
+        """
+        rank = len(singular_values)
+        if u.num_cols() < rank or v.num_cols() < rank:
+            raise ValueError("Not enough singular vectors for the singular values")
+        self.max_rank = max_rank
+        self.tol = tol
+        self._set_factors(u.all_cols()[:rank], list(singular_values), v.all_cols()[:rank],
+                          u.num_rows(), v.num_rows())
+
+    def _set_factors(self: IncrementalSVD, u_cols: List[List[float]], singular_values: List[float],
+                     v_cols: List[List[float]], num_rows: int, num_cols: int):
+        largest = max(singular_values, default=0)
+        rank = len([value for value in singular_values if value > self.tol * largest])
+        if self.max_rank is not None:
+            rank = min(rank, self.max_rank)
+        self._num_rows = num_rows
+        self._num_cols = num_cols
+        self.singular_values = singular_values[:rank]
+        self._u_cols = [list(col) for col in u_cols[:rank]]
+        self._v_cols = [list(col) for col in v_cols[:rank]]
+
+    @property
+    def u(self: IncrementalSVD) -> Matrix:
+        return Matrix.from_cols([col[:] for col in self._u_cols])
+
+    @property
+    def v(self: IncrementalSVD) -> Matrix:
+        return Matrix.from_cols([col[:] for col in self._v_cols])
+
+    def rank(self: IncrementalSVD) -> int:
+        return len(self.singular_values)
+
+    def size(self: IncrementalSVD) -> (int, int):
+        """Get the dimensions of the factorized matrix."""
+        return (self._num_rows, self._num_cols)
+
+    def to_matrix(self: IncrementalSVD) -> Matrix:
+        """Reconstructs U diag(s) V^T."""
+        if self.rank() == 0:
+            return Matrix.zeroes(self._num_rows, self._num_cols)
+        scaled = DiagonalMatrix(self.singular_values).multiply_right(self.u)
+        return scaled.multiply(self.v, transpose_other=True)
+
+    @staticmethod
+    def _project(basis: List[List[float]], vector: List[float]) -> (List[float], List[float], float):
+        # Splits vector into basis * coefficients + norm * direction, with direction
+        # orthogonal to the basis. Orthogonalizes twice for numerical stability.
+        coefficients = [0] * len(basis)
+        residual = list(vector)
+        for _ in range(2):
+            for index, col in enumerate(basis):
+                dot = Matrix.column_dot(col, residual)
+                coefficients[index] += dot
+                residual = Matrix.column_add(residual, Matrix.column_scale(col, -dot))
+        norm = math.sqrt(Matrix.column_dot(residual, residual))
+        scale = max(1.0, math.sqrt(Matrix.column_dot(vector, vector)))
+        if norm <= 1e-12 * scale:
+            # vector lies in the span of the basis
+            return coefficients, [0] * len(vector), 0
+        return coefficients, Matrix.column_scale(residual, 1 / norm), norm
+
+    def _apply_core(self: IncrementalSVD, core: Matrix, u_cols: List[List[float]],
+                    v_cols: List[List[float]], num_rows: int, num_cols: int):
+        # With A = [U u_new] core [V v_new]^T, diagonalize the small core matrix
+        core_u, core_s, core_v = compute_svd(core)
+        u = Matrix.from_cols(u_cols).multiply(core_u)
+        v = Matrix.from_cols(v_cols).multiply(core_v)
+        singular_values = [core_s.get(i, i) for i in range(core.num_cols())]
+        self._set_factors(u.all_cols(), singular_values, v.all_cols(), num_rows, num_cols)
+
+    def add_column(self: IncrementalSVD, col: List[float]):
+        """Updates the factorization of A to that of [A col].
+
+        Raises
+        ------
+        ValueError
+            If the column has the wrong dimension.
+        """
+        if len(col) != self._num_rows:
+            raise ValueError("Column has the wrong dimension")
+        rank = self.rank()
+        coefficients, direction, norm = IncrementalSVD._project(self._u_cols, col)
+        # [A col] = [U direction] [[diag(s), coefficients], [0, norm]] [[V, 0], [0, 1]]^T
+        core_cols = [[0] * (rank + 1) for _ in range(rank + 1)]
+        for index, value in enumerate(self.singular_values):
+            core_cols[index][index] = value
+        core_cols[rank] = coefficients + [norm]
+        u_cols = self._u_cols + [direction]
+        v_cols = [col + [0] for col in self._v_cols] + [[0] * self._num_cols + [1]]
+        self._apply_core(Matrix.from_cols(core_cols), u_cols, v_cols,
+                         self._num_rows, self._num_cols + 1)
+
+    def update(self: IncrementalSVD, a: List[float], b: List[float]):
+        """Updates the factorization of A to that of A + a b^T.
+
+        Raises
+        ------
+        ValueError
+            If the vectors have the wrong dimensions.
+        """
+        if len(a) != self._num_rows or len(b) != self._num_cols:
+            raise ValueError("Vectors have the wrong dimensions")
+        a_coefficients, a_direction, a_norm = IncrementalSVD._project(self._u_cols, a)
+        b_coefficients, b_direction, b_norm = IncrementalSVD._project(self._v_cols, b)
+        # A + a b^T = [U a_dir] ([[diag(s), 0], [0, 0]] + [m; a_norm] [n; b_norm]^T) [V b_dir]^T
+        left = a_coefficients + [a_norm]
+        right = b_coefficients + [b_norm]
+        core_cols = [Matrix.column_scale(left, elem) for elem in right]
+        for index, value in enumerate(self.singular_values):
+            core_cols[index][index] += value
+        self._apply_core(Matrix.from_cols(core_cols),
+                         self._u_cols + [a_direction], self._v_cols + [b_direction],
+                         self._num_rows, self._num_cols)
@@ -0,0 +1,120 @@
+from pylinlin.matrix import Matrix
+from pylinlin.householder import Householder
+from pylinlin.givens import Givens
+from typing import List
+import math
+import sys
+
+
+def reduce_to_tridiagonal(mat: Matrix) -> (Matrix, List[Householder]):
+    # mat = Q T Q^T where Q is the product of the returned householder
+    # transformations, the k-th of which acts on rows and columns k + 1 onwards
+    mat = mat.copy()
+    if mat.num_rows() != mat.num_cols():
+        raise ValueError("Matrix should be square")
+    householders = []
+    for iteration in range(mat.num_rows() - 2):
+        # clear zeroes below subdiagonal, and symmetrically above superdiagonal
+        col = mat.get_col(iteration)[iteration + 1:]
+        householder = Householder(col)
+        mat = householder.multiply_left(mat, pad_top=iteration + 1)
+        mat = householder.multiply_right(mat, pad_top=iteration + 1)
+        householders.append(householder)
+    return mat, householders
+
+
+def implicit_qr_step(diagonal: List[float], offdiagonal: List[float],
+                     start: int, end: int, vectors: Matrix = None):
+    # One implicit-shift QR sweep on the unreduced block start..end of the
+    # symmetric tridiagonal matrix, chasing the bulge with givens rotations.
+    # Wilkinson shift: eigenvalue of the trailing 2x2 block closer to its last entry
+    delta = (diagonal[end - 1] - diagonal[end]) / 2
+    off = offdiagonal[end - 1]
+    shift = diagonal[end] - off * off / (delta + math.copysign(math.hypot(delta, off), delta))
+    x = diagonal[start] - shift
+    z = offdiagonal[start]
+    for k in range(start, end):
+        givens = Givens(x, z)
+        c, s = givens.x1, givens.x2
+        if k > start:
+            # zero the bulge introduced by the previous rotation
+            offdiagonal[k - 1] = c * offdiagonal[k - 1] + s * z
+        d1, d2, e = diagonal[k], diagonal[k + 1], offdiagonal[k]
+        diagonal[k] = c * c * d1 + 2 * c * s * e + s * s * d2
+        diagonal[k + 1] = s * s * d1 - 2 * c * s * e + c * c * d2
+        offdiagonal[k] = c * s * (d2 - d1) + (c * c - s * s) * e
+        if k < end - 1:
+            # the rotation introduces a bulge at (k, k + 2)
+            x = offdiagonal[k]
+            z = s * offdiagonal[k + 1]
+            offdiagonal[k + 1] = c * offdiagonal[k + 1]
+        if vectors is not None:
+            givens.transpose().apply_right_inplace(vectors, k, k + 1)
+
+
+def compute_symmetric_tridiagonal_eig(diagonal: List[float], offdiagonal: List[float],
+                                      vectors: Matrix = None) -> List[float]:
+    # Overwrites the diagonal with the eigenvalues, and accumulates the
+    # rotations into the columns of vectors if given
+    dims = len(diagonal)
+    eps = sys.float_info.epsilon
+    max_iterations = 30 * dims
+    iterations = 0
+    end = dims - 1
+    while end > 0:
+        # deflate once the last offdiagonal entry is negligible
+        if abs(offdiagonal[end - 1]) <= eps * (abs(diagonal[end - 1]) + abs(diagonal[end])):
+            offdiagonal[end - 1] = 0
+            end -= 1
+            continue
+        # find the start of the unreduced block ending at end
+        start = end - 1
+        while start > 0:
+            if abs(offdiagonal[start - 1]) <= eps * (abs(diagonal[start - 1]) + abs(diagonal[start])):
+                offdiagonal[start - 1] = 0
+                break
+            start -= 1
+        iterations += 1
+        if iterations > max_iterations:
+            raise ValueError("Symmetric QR iteration did not converge")
+        implicit_qr_step(diagonal, offdiagonal, start, end, vectors)
+    return diagonal
+
+
+def check_symmetric(mat: Matrix):
+    if mat.num_rows() != mat.num_cols():
+        raise ValueError("Matrix should be square")
+    tol = 1e-10 * mat.frobenius_norm()
+    for i in range(mat.num_rows()):
+        for j in range(i):
+            if abs(mat.get(i, j) - mat.get(j, i)) > tol:
+                raise ValueError("Matrix should be symmetric")
+
+
+def compute_symmetric_eig(mat: Matrix) -> (List[float], Matrix):
+    # mat = Q diag(eigenvalues) Q^T, eigenvalues in decreasing order
+    check_symmetric(mat)
+    dims = mat.num_rows()
+    t, householders = reduce_to_tridiagonal(mat)
+    # Accumulate the householder transformations
+    q = Matrix.identity(dims)
+    for index, hh in list(enumerate(householders))[::-1]:
+        q = hh.multiply_left(q, pad_top=index + 1)
+    diagonal = [t.get(i, i) for i in range(dims)]
+    offdiagonal = [t.get(i + 1, i) for i in range(dims - 1)]
+    compute_symmetric_tridiagonal_eig(diagonal, offdiagonal, q)
+    order = sorted(range(dims), key=lambda index: diagonal[index], reverse=True)
+    eigenvalues = [diagonal[index] for index in order]
+    eigenvectors = Matrix.from_cols([q.get_col(index) for index in order])
+    return eigenvalues, eigenvectors
+
+
+def compute_symmetric_eigenvalues(mat: Matrix) -> List[float]:
+    # Same as compute_symmetric_eig but skips accumulating the eigenvectors
+    check_symmetric(mat)
+    t, _ = reduce_to_tridiagonal(mat)
+    dims = mat.num_rows()
+    diagonal = [t.get(i, i) for i in range(dims)]
+    offdiagonal = [t.get(i + 1, i) for i in range(dims - 1)]
+    compute_symmetric_tridiagonal_eig(diagonal, offdiagonal)
+    return sorted(diagonal, reverse=True)
@@ -0,0 +1,51 @@
+import json
+from pylinlin.bench import \
+    CASES, \
+    percentile, \
+    run_benchmarks, \
+    compare_results, \
+    over_budget, \
+    main
+
+
+class TestBench:
+
+    def test_percentile(self):
+        timings = list(range(1, 21))
+        assert percentile(timings, 0.5) == 10
+        assert percentile(timings, 0.95) == 19
+        assert percentile([3], 0.95) == 3
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(list(CASES), [2], ["square", "tall", "wide"], repeat=2, warmup=0)
+        assert len(results) == 3 * len(CASES)
+        for result in results:
+            assert result["median"] <= result["p95"]
+            assert result["min"] <= result["median"]
+        tall = [result for result in results if result["shape"] == "tall"]
+        assert all(result["rows"] == 4 and result["cols"] == 2 for result in tall)
+
+    def test_memory(self):
+        results = run_benchmarks(["qr"], [4], ["square"], repeat=1, warmup=0, memory=True)
+        assert 0 < results[0]["peak_bytes"] <= results[0]["memory_budget"]
+        assert over_budget(results) == []
+        assert over_budget([dict(results[0], memory_budget=0)]) != []
+
+    def test_compare_results(self):
+        baseline = [{"case": "qr", "shape": "square", "size": 4, "median": 1.0}]
+        results = [
+            {"case": "qr", "shape": "square", "size": 4, "median": 1.5},
+            {"case": "lu", "shape": "square", "size": 4, "median": 9.0},
+        ]
+        regressions = compare_results(results, baseline, 1.25)
+        assert len(regressions) == 1
+        assert regressions[0]["ratio"] == 1.5
+        assert compare_results(results, baseline, 2) == []
+
+    def test_main(self, tmp_path):
+        output = tmp_path / "results.json"
+        args = ["--cases", "qr", "--sizes", "2", "--shapes", "square", "--repeat", "2"]
+        assert main(args + ["--output", str(output)]) == 0
+        saved = json.loads(output.read_text())
+        assert saved["results"][0]["case"] == "qr"
+        assert main(args + ["--baseline", str(output), "--threshold", "1000"]) == 0
@@ -0,0 +1,65 @@
+from pylinlin.matrix import Matrix
+from pylinlin.cache import FactorizationCache
+from pylinlin.lu_factorization import compute_lu_factorization
+import pylinlin.matrix_utils as utils
+
+
+class TestCache:
+
+    def test_cache_hit(self):
+        cache = FactorizationCache()
+        mat = Matrix.from_cols([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        l1, u1 = cache.compute_lu_factorization(mat)
+        l2, u2 = cache.compute_lu_factorization(mat.copy())
+        expected_l, expected_u = compute_lu_factorization(mat)
+        utils.assert_matrix_equal(l2, expected_l)
+        utils.assert_matrix_equal(u2, expected_u)
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["bytes"] == 18 * 8
+
+    def test_cache_keys(self):
+        cache = FactorizationCache()
+        mat = Matrix.from_cols([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        cache.compute_lu_factorization(mat)
+        cache.compute_qr_factorization(mat)
+        cache.compute_lu_factorization(Matrix.from_cols([[1, 2, 3], [4, 5, 6], [7, 8, 11]]))
+        cache.compute_lu_factorization(Matrix.from_rows([[1, 2, 3], [4, 5, 6], [7, 8, 10]]))
+        assert cache.stats()["misses"] == 4
+        assert cache.stats()["hits"] == 0
+
+    def test_cache_results_isolated(self):
+        cache = FactorizationCache()
+        mat = Matrix.from_cols([[1, 2], [3, 4]])
+        q, r = cache.compute_qr_factorization(mat)
+        q.all_cols()[0][0] = 100
+        q2, r2 = cache.compute_qr_factorization(mat)
+        assert q2.get(0, 0) != 100
+        utils.assert_matrix_equal(q2.multiply(r2), mat)
+
+    def test_cache_eviction(self):
+        # each LU of a 2 x 2 matrix packs 8 doubles
+        cache = FactorizationCache(max_bytes=2 * 8 * 8)
+        mats = [Matrix.from_cols([[i + 1, 2], [3, 4]]) for i in range(3)]
+        for mat in mats:
+            cache.compute_lu_factorization(mat)
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= stats["max_bytes"]
+        # most recently used entries are kept
+        cache.compute_lu_factorization(mats[2])
+        assert cache.stats()["hits"] == 1
+        cache.compute_lu_factorization(mats[0])
+        assert cache.stats()["misses"] == 4
+
+    def test_cache_too_large(self):
+        cache = FactorizationCache(max_bytes=8)
+        mat = Matrix.from_cols([[1, 2], [3, 4]])
+        cache.compute_lu_factorization(mat)
+        assert cache.stats()["entries"] == 0
+        cache.compute_svd(mat)
+        cache.clear()
+        assert cache.stats()["bytes"] == 0
@@ -0,0 +1,89 @@
+from pylinlin.matrix import Matrix
+from pylinlin.lu_factorization import compute_lu_factorization
+from pylinlin.qr_factorization import compute_qr_factorization
+from pylinlin.svd import compute_svd
+from pylinlin.generate import generate_matrix_normal
+from pylinlin.bench import memory_budget
+from pylinlin.instrumentation import \
+    instrument, \
+    current_session, \
+    measure_peak_memory, \
+    phase, \
+    count, \
+    add_flops
+import json
+import tracemalloc
+
+
+class TestInstrumentation:
+
+    def test_disabled(self):
+        assert current_session() is None
+        with phase("unused"):
+            count("unused")
+            add_flops(10)
+        with instrument() as session:
+            assert current_session() is session
+        assert current_session() is None
+        assert session.phases == {}
+
+    def test_phases(self):
+        events = []
+        with instrument(lambda *event: events.append(event)) as session:
+            with phase("outer"):
+                add_flops(5)
+                with phase("inner"):
+                    add_flops(3)
+                    count("steps")
+                    count("steps", 2)
+        assert session.phases["outer"].calls == 1
+        assert session.phases["outer"].flops == 5
+        assert session.phases["inner"].flops == 3
+        assert session.phases["outer"].seconds >= session.phases["inner"].seconds
+        assert session.flops == 8
+        assert session.counters["steps"] == 3
+        assert events[0] == ("count", "steps", 1)
+        assert [event[:2] for event in events[2:]] == [("phase", "inner"), ("phase", "outer")]
+
+    def test_factorizations(self):
+        mat = Matrix.from_cols([[1, 2, 3], [2, 5, 1], [-1, 3, -2]])
+        with instrument() as session:
+            compute_lu_factorization(mat)
+            compute_qr_factorization(mat)
+        assert session.counters["lu.iterations"] == 3
+        assert session.counters["qr.iterations"] == 3
+        assert session.phases["lu"].calls == 1
+        assert session.phases["qr.factorize"].flops > 0
+        assert session.allocations > 0
+        assert session.copies >= 2
+
+    def test_svd(self):
+        mat = Matrix.from_cols([[1, 2, 3, 1], [2, 5, 1, 0], [-1, 3, -2, -2]])
+        with instrument() as session:
+            compute_svd(mat)
+        for name in ["svd.qr", "svd.bidiagonalization", "svd.bidiagonal_svd",
+                     "svd.accumulate_u", "svd.accumulate_v"]:
+            assert session.phases[name].calls >= 1
+        assert session.counters["svd.sweeps"] > 0
+        # deflated sweeps only rotate the active block
+        assert session.counters["svd.sweeps"] <= session.counters["svd.givens_rotations"]
+        assert session.counters["svd.givens_rotations"] <= 4 * session.counters["svd.sweeps"]
+        report = json.loads(session.to_json())
+        assert report["counters"]["svd.sweeps"] == session.counters["svd.sweeps"]
+
+    def test_memory(self):
+        mat = Matrix.from_cols([[1, 2, 3], [2, 5, 1], [-1, 3, -2]])
+        with instrument(memory=True) as session:
+            compute_qr_factorization(mat)
+        assert session.peak_bytes > 0
+        for name in ["qr.factorize", "qr.accumulate_q"]:
+            assert 0 < session.phases[name].peak_bytes <= session.peak_bytes
+            assert session.phases[name].allocations > 0
+        assert not tracemalloc.is_tracing()
+
+    def test_memory_budget(self):
+        # QR and LU of an n x n matrix should allocate O(n^2) bytes
+        for func in [compute_qr_factorization, compute_lu_factorization]:
+            for size in [8, 16, 32]:
+                mat = generate_matrix_normal(size)
+                assert measure_peak_memory(func, mat) <= memory_budget(size, size)
@@ -1,6 +1,11 @@
 from pylinlin.matrix import Matrix
-from pylinlin.lu_factorization import compute_lu_factorization
+from pylinlin.sparse_matrix import SparseMatrix
+from pylinlin.lu_factorization import \
+    compute_lu_factorization, \
+    compute_sparse_lu_factorization, \
+    solve_sparse_lu_factorization
 import pylinlin.matrix_utils as utils
+import pytest
 
 
 class TestLUFactorization:
@@ -49,3 +54,59 @@ class TestLUFactorization:
         assert self.vector_all(utils.extract_diagonal(mat_l), 1)
         product = mat_l.multiply(mat_u)
         assert product.all_cols() == matrix.all_cols()
+
+    def check_sparse_lu(self, matrix: Matrix, ordering: str):
+        sparse = SparseMatrix.from_matrix(matrix)
+        mat_l, mat_u, row_perm, col_perm = compute_sparse_lu_factorization(
+            sparse, ordering)
+        dense_l = mat_l.to_matrix()
+        dense_u = mat_u.to_matrix()
+        utils.assert_lower_triangular(dense_l)
+        utils.assert_upper_triangular(dense_u)
+        assert self.vector_all(utils.extract_diagonal(dense_l), 1)
+        permuted = Matrix.from_cols(
+            [[matrix.get(row, col) for row in row_perm] for col in col_perm])
+        utils.assert_matrix_equal(dense_l.multiply(dense_u), permuted)
+        expected = [1, -2, 3, 0.5, 2][:matrix.num_cols()]
+        rhs = matrix.multiply_column(expected)
+        solution = solve_sparse_lu_factorization(
+            mat_l, mat_u, row_perm, col_perm, rhs)
+        assert solution == pytest.approx(expected)
+
+    def test_sparse_lu(self):
+        matrix = Matrix.from_cols([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        for ordering in ["natural", "colcount"]:
+            self.check_sparse_lu(matrix, ordering)
+
+    def test_sparse_lu_needs_pivoting(self):
+        matrix = Matrix.from_cols([
+            [0, 2, 0, 0, 1],
+            [3, 0, 0, 1, 0],
+            [0, 0, 4, 0, 0],
+            [1, 0, 0, 0, 5],
+            [0, 1, 2, 0, 0]])
+        for ordering in ["natural", "colcount"]:
+            self.check_sparse_lu(matrix, ordering)
+
+    def test_sparse_lu_singular(self):
+        sparse = SparseMatrix.from_matrix(
+            Matrix.from_cols([[1, 2, 0], [2, 4, 0], [0, 0, 1]]))
+        with pytest.raises(ValueError):
+            compute_sparse_lu_factorization(sparse)
+
+    def test_sparse_lu_tridiagonal(self):
+        dims = 2000
+        triplets = []
+        for i in range(dims):
+            triplets.append((i, i, 4))
+            if i > 0:
+                triplets.append((i, i - 1, -1))
+                triplets.append((i - 1, i, -1))
+        sparse = SparseMatrix.from_triplets(dims, dims, triplets)
+        mat_l, mat_u, row_perm, col_perm = compute_sparse_lu_factorization(sparse)
+        # no fill-in for a tridiagonal matrix
+        assert mat_l.num_nonzeros() + mat_u.num_nonzeros() == sparse.num_nonzeros() + dims
+        expected = [1] * dims
+        solution = solve_sparse_lu_factorization(
+            mat_l, mat_u, row_perm, col_perm, sparse.multiply_column(expected))
+        assert solution == pytest.approx(expected)
@@ -0,0 +1,103 @@
+from pylinlin.matrix import Matrix
+from pylinlin.qr_factorization import compute_qr_factorization
+from pylinlin.qr_update import \
+    qr_insert_row, \
+    qr_delete_row, \
+    qr_insert_col, \
+    qr_delete_col, \
+    qr_rank_one_update
+import pylinlin.matrix_utils as utils
+import pytest
+
+
+class TestQRUpdate:
+
+    def check_qr(self, q: Matrix, r: Matrix, mat: Matrix):
+        utils.assert_orthonormal(q)
+        utils.assert_upper_triangular(r)
+        utils.assert_matrix_equal(q.multiply(r), mat)
+
+    def matrices(self):
+        return [
+            Matrix.from_cols([[1, 2, 3], [4, 5, 6], [7, 8, 10]]),
+            Matrix.from_cols([[1, 2, 3, 5], [4, 5, 6, 8], [7, 8, 10, 1]]),
+            Matrix.from_cols([[1, 2, 3], [4, 5, 6], [7, 8, 10], [-1, 0, 0]]),
+        ]
+
+    def test_insert_row(self):
+        for mat in self.matrices():
+            q, r = compute_qr_factorization(mat)
+            row = [float(i) - 1.5 for i in range(mat.num_cols())]
+            for index in range(mat.num_rows() + 1):
+                rows = [mat.get_row(i) for i in range(mat.num_rows())]
+                expected = Matrix.from_rows(rows[:index] + [row] + rows[index:])
+                self.check_qr(*qr_insert_row(q, r, row, index), expected)
+
+    def test_delete_row(self):
+        for mat in self.matrices():
+            q, r = compute_qr_factorization(mat)
+            for index in range(mat.num_rows()):
+                rows = [mat.get_row(i) for i in range(mat.num_rows())]
+                expected = Matrix.from_rows(rows[:index] + rows[index + 1:])
+                self.check_qr(*qr_delete_row(q, r, index), expected)
+
+    def test_insert_col(self):
+        for mat in self.matrices():
+            q, r = compute_qr_factorization(mat)
+            col = [2.0 - i for i in range(mat.num_rows())]
+            for index in range(mat.num_cols() + 1):
+                cols = mat.all_cols()
+                expected = Matrix.from_cols(cols[:index] + [col] + cols[index:])
+                self.check_qr(*qr_insert_col(q, r, col, index), expected)
+
+    def test_delete_col(self):
+        for mat in self.matrices():
+            q, r = compute_qr_factorization(mat)
+            for index in range(mat.num_cols()):
+                cols = mat.all_cols()
+                expected = Matrix.from_cols(cols[:index] + cols[index + 1:])
+                self.check_qr(*qr_delete_col(q, r, index), expected)
+
+    def test_rank_one_update(self):
+        for mat in self.matrices():
+            q, r = compute_qr_factorization(mat)
+            u = [1.0 + i for i in range(mat.num_rows())]
+            v = [0.5 - i for i in range(mat.num_cols())]
+            expected = mat.copy()
+            for col, elem in zip(expected.all_cols(), v):
+                for i in range(len(col)):
+                    col[i] += u[i] * elem
+            self.check_qr(*qr_rank_one_update(q, r, u, v), expected)
+
+    def test_sliding_window(self):
+        rows = [[1, 2], [3, 1], [0, 4], [2, 2], [5, -1], [1, 1]]
+        q, r = compute_qr_factorization(Matrix.from_rows(rows[:3]))
+        for start in range(1, 4):
+            q, r = qr_insert_row(q, r, rows[start + 2], 3)
+            q, r = qr_delete_row(q, r, 0)
+            self.check_qr(q, r, Matrix.from_rows(rows[start:start + 3]))
+
+    def test_update_does_not_modify_inputs(self):
+        mat = Matrix.from_cols([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        q, r = compute_qr_factorization(mat)
+        q_copy, r_copy = q.copy(), r.copy()
+        qr_rank_one_update(q, r, [1, 1, 1], [1, 2, 3])
+        qr_delete_col(q, r, 0)
+        qr_insert_col(q, r, [1, 2, 3], 1)
+        qr_delete_row(q, r, 1)
+        assert q.all_cols() == q_copy.all_cols()
+        assert r.all_cols() == r_copy.all_cols()
+
+    def test_update_fail(self):
+        mat = Matrix.from_cols([[1, 2], [3, 4]])
+        q, r = compute_qr_factorization(mat)
+        with pytest.raises(ValueError):
+            qr_insert_row(q, r, [1, 2, 3], 0)
+        with pytest.raises(ValueError):
+            qr_delete_row(q, r, 2)
+        with pytest.raises(ValueError):
+            qr_insert_col(q, r, [1], 0)
+        with pytest.raises(ValueError):
+            qr_delete_col(q, r, -1)
+        with pytest.raises(ValueError):
+            qr_rank_one_update(q, r, [1, 2], [1])
@@ -0,0 +1,49 @@
+from pylinlin.matrix import Matrix
+from pylinlin.sparse_matrix import SparseMatrix
+import pylinlin.matrix_utils as utils
+import pytest
+
+
+class TestSparseMatrix:
+
+    def test_from_triplets(self):
+        sparse = SparseMatrix.from_triplets(
+            3, 2, [(0, 0, 1), (2, 0, 2), (1, 1, 3), (1, 1, 1), (0, 1, 0)])
+        assert sparse.size() == (3, 2)
+        assert sparse.num_nonzeros() == 3
+        assert sparse.to_matrix().all_cols() == [[1, 0, 2], [0, 4, 0]]
+        with pytest.raises(ValueError):
+            SparseMatrix.from_triplets(2, 2, [(2, 0, 1)])
+
+    def test_from_matrix(self):
+        mat = Matrix.from_cols([[1, 0, 0], [0, 0, 5], [2, 3, 0]])
+        sparse = SparseMatrix.from_matrix(mat)
+        assert sparse.num_nonzeros() == 4
+        assert sparse.get(2, 1) == 5
+        assert sparse.get(1, 1) == 0
+        assert sparse.get_col(2) == [2, 3, 0]
+        assert sparse.to_matrix().all_cols() == mat.all_cols()
+
+    def test_transpose(self):
+        mat = Matrix.from_cols([[1, 0, 4], [0, 0, 5], [2, 3, 0], [0, 7, 0]])
+        sparse = SparseMatrix.from_matrix(mat)
+        transpose = sparse.transpose()
+        assert transpose.size() == (4, 3)
+        assert transpose.to_matrix().all_cols() == mat.transpose().all_cols()
+
+    def test_multiply(self):
+        mat = Matrix.from_cols([[1, 0, 4], [0, 0, 5], [2, 3, 0]])
+        dense = Matrix.from_cols([[1, 2, 3], [-1, 0, 2]])
+        sparse = SparseMatrix.from_matrix(mat)
+        assert sparse.multiply_column([1, 2, 3]) == mat.multiply_column([1, 2, 3])
+        assert sparse.multiply_column_transposed([1, 2, 3]) == \
+            mat.multiply(Matrix.from_cols([[1, 2, 3]]), transpose_self=True).get_col(0)
+        utils.assert_matrix_equal(sparse.multiply(dense), mat.multiply(dense))
+        with pytest.raises(ValueError):
+            sparse.multiply(Matrix.identity(2))
+
+    def test_large_identity(self):
+        sparse = SparseMatrix.identity(50000)
+        assert sparse.num_nonzeros() == 50000
+        vector = list(range(50000))
+        assert sparse.multiply_column(vector) == vector
@@ -0,0 +1,84 @@
+from pylinlin.matrix import Matrix
+from pylinlin.structured_matrix import \
+    BandedMatrix, \
+    TriangularMatrix, \
+    DiagonalMatrix
+from pylinlin.lu_factorization import compute_lu_factorization
+from pylinlin.svd import compute_svd
+import pylinlin.matrix_utils as utils
+import pytest
+
+
+class TestStructuredMatrix:
+
+    def test_banded(self):
+        mat = Matrix.from_cols([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]])
+        band = BandedMatrix.from_matrix(mat, 1, 1)
+        assert band.size() == (4, 3)
+        assert band.get(3, 0) == 0
+        assert band.get(1, 0) == 2
+        assert band.to_matrix().all_cols() == [[1, 2, 0, 0], [5, 6, 7, 0], [0, 10, 11, 12]]
+        dense = band.to_matrix()
+        utils.assert_matrix_equal(band.transpose().to_matrix(), dense.transpose())
+        other = Matrix.from_cols([[1, -1, 2], [0, 3, 1]])
+        utils.assert_matrix_equal(band.multiply(other), dense.multiply(other))
+        left = Matrix.from_rows([[1, 0, 2, -1], [3, 1, 0, 1]])
+        utils.assert_matrix_equal(band.multiply_right(left), left.multiply(dense))
+        with pytest.raises(ValueError):
+            band.multiply(dense)
+
+    def test_banded_fail(self):
+        with pytest.raises(ValueError):
+            BandedMatrix(3, 3, -1, 0)
+        with pytest.raises(ValueError):
+            BandedMatrix(3, 3, 0, 0, [[1], [2], [3, 4]])
+
+    def test_triangular(self):
+        mat = Matrix.from_cols([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        lower = TriangularMatrix.from_matrix(mat, lower=True)
+        upper = TriangularMatrix.from_matrix(mat, lower=False)
+        utils.assert_lower_triangular(lower.to_matrix())
+        utils.assert_upper_triangular(upper.to_matrix())
+        assert lower.transpose().lower is False
+        utils.assert_matrix_equal(lower.transpose().to_matrix(), lower.to_matrix().transpose())
+        utils.assert_matrix_equal(upper.multiply(mat), upper.to_matrix().multiply(mat))
+
+    def test_triangular_rectangular(self):
+        mat = Matrix.from_cols([[1, 2], [3, 4], [5, 6]])
+        upper = TriangularMatrix.from_matrix(mat, lower=False)
+        assert upper.to_matrix().all_cols() == [[1, 0], [3, 4], [5, 6]]
+        utils.assert_matrix_equal(upper.transpose().to_matrix(), upper.to_matrix().transpose())
+
+    def test_triangular_solve(self):
+        mat = Matrix.from_cols([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        mat_l, mat_u = compute_lu_factorization(mat)
+        lower = TriangularMatrix.from_matrix(mat_l, lower=True)
+        upper = TriangularMatrix.from_matrix(mat_u, lower=False)
+        expected = [1, -2, 3]
+        rhs = mat.multiply_column(expected)
+        assert upper.solve(lower.solve(rhs)) == pytest.approx(expected)
+        rhs = mat.multiply(Matrix.from_cols([expected]), transpose_self=True).get_col(0)
+        assert lower.solve(upper.solve(rhs, transpose=True), transpose=True) == pytest.approx(expected)
+        with pytest.raises(ValueError):
+            TriangularMatrix(2, 2, True, [[0, 1], [1]]).solve([1, 1])
+
+    def test_diagonal(self):
+        diagonal = DiagonalMatrix([1, 2, 3])
+        assert diagonal.to_matrix().all_cols() == [[1, 0, 0], [0, 2, 0], [0, 0, 3]]
+        assert diagonal.multiply_column([1, 1, 1]) == [1, 2, 3]
+        assert diagonal.solve([1, 2, 3]) == pytest.approx([1, 1, 1])
+        wide = DiagonalMatrix([1, 2], 2, 3)
+        assert wide.to_matrix().all_cols() == [[1, 0], [0, 2], [0, 0]]
+        assert wide.transpose().size() == (3, 2)
+        mat = Matrix.from_cols([[1, 2], [3, 4]])
+        utils.assert_matrix_equal(wide.multiply_right(mat), mat.multiply(wide.to_matrix()))
+        utils.assert_matrix_equal(wide.transpose().multiply(mat), wide.to_matrix().transpose().multiply(mat))
+        with pytest.raises(ValueError):
+            DiagonalMatrix([1, 2], 3, 3)
+
+    def test_svd_reconstruct(self):
+        mat = Matrix.from_cols([[1, 2, 3, 1], [2, 5, 1, 0], [-1, 3, -2, -2]])
+        u, s, v = compute_svd(mat)
+        s = DiagonalMatrix.from_matrix(s)
+        product = s.multiply_right(u).multiply(v, transpose_other=True)
+        utils.assert_matrix_equal(product, mat)
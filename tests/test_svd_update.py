@@ -0,0 +1,69 @@
+import pytest
+from pylinlin.matrix import Matrix
+from pylinlin.svd_update import IncrementalSVD
+import pylinlin.matrix_utils as utils
+
+
+class TestSVDUpdate:
+
+    def check_svd(self, svd: IncrementalSVD, mat: Matrix):
+        assert svd.size() == mat.size()
+        for i in range(svd.rank() - 1):
+            assert svd.singular_values[i] >= svd.singular_values[i + 1]
+        for basis in [svd.u, svd.v]:
+            gram = basis.multiply(basis, transpose_self=True)
+            utils.assert_matrix_equal(gram, Matrix.identity(svd.rank()))
+        utils.assert_matrix_equal(svd.to_matrix(), mat)
+
+    def test_from_matrix(self):
+        mat = Matrix.from_cols([[1, 2, 3, 1], [2, 5, 1, 0], [-1, 3, -2, -2]])
+        svd = IncrementalSVD.from_matrix(mat)
+        assert svd.rank() == 3
+        self.check_svd(svd, mat)
+
+    def test_from_matrix_low_rank(self):
+        mat = Matrix.from_cols([[1, 2, 3], [2, 4, 6], [1, 0, 1]])
+        svd = IncrementalSVD.from_matrix(mat)
+        assert svd.rank() == 2
+        self.check_svd(svd, mat)
+
+    def test_add_column(self):
+        cols = [[1, 2, 3, 1], [2, 5, 1, 0], [-1, 3, -2, -2], [0, 1, 1, 4], [3, 7, 4, 1]]
+        svd = IncrementalSVD.from_matrix(Matrix.from_cols(cols[:1]))
+        for count in range(2, len(cols) + 1):
+            svd.add_column(cols[count - 1])
+            self.check_svd(svd, Matrix.from_cols(cols[:count]))
+        # the last column is the sum of the first two
+        assert svd.rank() == 4
+
+    def test_update(self):
+        mat = Matrix.from_cols([[1, 2, 3, 1], [2, 5, 1, 0], [-1, 3, -2, -2]])
+        svd = IncrementalSVD.from_matrix(mat)
+        a = [1, -1, 0.5, 2]
+        b = [0.5, 1, -1]
+        svd.update(a, b)
+        expected = Matrix.from_cols(
+            [Matrix.column_add(col, Matrix.column_scale(a, elem)) for col, elem in zip(mat.all_cols(), b)])
+        self.check_svd(svd, expected)
+
+    def test_update_within_span(self):
+        mat = Matrix.from_cols([[1, 0, 0], [0, 2, 0]])
+        svd = IncrementalSVD.from_matrix(mat)
+        svd.update([1, 0, 0], [0, 1])
+        self.check_svd(svd, Matrix.from_cols([[1, 0, 0], [1, 2, 0]]))
+        assert svd.rank() == 2
+
+    def test_truncated(self):
+        mat = Matrix.from_cols([[3, 0, 0], [0, 2, 0], [0, 0, 1]])
+        svd = IncrementalSVD.from_matrix(mat, max_rank=2)
+        assert svd.singular_values == pytest.approx([3, 2])
+        svd.add_column([0, 0, 5])
+        assert svd.singular_values == pytest.approx([5, 3])
+        assert svd.v.num_rows() == 4
+
+    def test_fail(self):
+        svd = IncrementalSVD.from_matrix(Matrix.from_cols([[1, 2], [3, 4]]))
+        with pytest.raises(ValueError):
+            svd.add_column([1, 2, 3])
+        with pytest.raises(ValueError):
+            svd.update([1, 2], [1])
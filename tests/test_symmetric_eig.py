@@ -0,0 +1,66 @@
+import pytest
+from pylinlin.matrix import Matrix
+import pylinlin.matrix_utils as utils
+from pylinlin.symmetric_eig import \
+    reduce_to_tridiagonal, \
+    compute_symmetric_eig, \
+    compute_symmetric_eigenvalues
+
+
+class TestSymmetricEig:
+
+    def check_eig(self, mat: Matrix):
+        eigenvalues, q = compute_symmetric_eig(mat)
+        utils.assert_orthonormal(q)
+        for i in range(len(eigenvalues) - 1):
+            assert eigenvalues[i] >= eigenvalues[i + 1]
+        for value, vector in zip(eigenvalues, q.all_cols()):
+            assert mat.multiply_column(vector) == pytest.approx(
+                Matrix.column_scale(vector, value), abs=1e-8)
+        assert compute_symmetric_eigenvalues(mat) == pytest.approx(eigenvalues)
+        return eigenvalues
+
+    def test_reduce_to_tridiagonal(self):
+        mat = Matrix.from_cols([[4, 1, 2, 2], [1, 2, 0, 1], [2, 0, 3, 2], [2, 1, 2, 1]])
+        t, householders = reduce_to_tridiagonal(mat)
+        for i in range(4):
+            for j in range(4):
+                if abs(i - j) > 1:
+                    assert t.get(i, j) == pytest.approx(0)
+        for index, hh in list(enumerate(householders))[::-1]:
+            t = hh.multiply_left(t, index + 1)
+            t = hh.multiply_right(t, index + 1)
+        utils.assert_matrix_equal(t, mat)
+
+    def test_symmetric_eig(self):
+        mat = Matrix.from_cols([[4, 1, 2, 2], [1, 2, 0, 1], [2, 0, 3, 2], [2, 1, 2, 1]])
+        self.check_eig(mat)
+
+    def test_symmetric_eig_indefinite(self):
+        mat = Matrix.from_cols([[2, 1, 0], [1, 2, 1], [0, 1, -3]])
+        eigenvalues = self.check_eig(mat)
+        assert eigenvalues[-1] < 0
+        assert sum(eigenvalues) == pytest.approx(1)
+
+    def test_symmetric_eig_known(self):
+        mat = Matrix.from_cols([[2, -1, 0], [-1, 2, -1], [0, -1, 2]])
+        eigenvalues = self.check_eig(mat)
+        assert eigenvalues == pytest.approx([2 + 2 ** 0.5, 2, 2 - 2 ** 0.5])
+
+    def test_symmetric_eig_diagonal(self):
+        mat = Matrix.from_cols([[1, 0, 0], [0, -5, 0], [0, 0, 3]])
+        assert self.check_eig(mat) == pytest.approx([3, 1, -5])
+
+    def test_symmetric_eig_repeated(self):
+        mat = Matrix.from_cols([[1, 1, 1], [1, 1, 1], [1, 1, 1]])
+        assert self.check_eig(mat) == pytest.approx([3, 0, 0], abs=1e-8)
+
+    def test_symmetric_eig_small(self):
+        assert self.check_eig(Matrix.from_cols([[-2]])) == [-2]
+        self.check_eig(Matrix.from_cols([[1, 2], [2, 1]]))
+
+    def test_symmetric_eig_fail(self):
+        with pytest.raises(ValueError):
+            compute_symmetric_eig(Matrix.from_cols([[1, 2], [3, 4]]))
+        with pytest.raises(ValueError):
+            compute_symmetric_eigenvalues(Matrix.from_cols([[1, 2, 3], [4, 5, 6]]))